@@ -0,0 +1,295 @@
+import click, sys
+from flask.cli import with_appcontext, AppGroup
+from App.database import get_migrate
+from App.models.staff import Staff
+from App.controllers import (
+    create_staff,
+    initialize,
+    import_students_csv,
+    import_reviews_csv,
+    add_student,
+    add_review,
+    parse_rating,
+    get_student,
+    iter_student_reviews_pages_json,
+    search,
+    rebuild_search_index,
+    refresh_leaderboards,
+    iter_reviews_export,
+    SEARCH_TYPES,
+    EXPORT_FORMATS
+)
+
+# The flask Command Line - Only Imported (By wsgi.py) When The App Is Loaded By `flask <command>`
+
+# This Command Creates & Initializes The Database
+@click.command("init", help="Creates & Initializes The Database")
+@with_appcontext
+def init():
+    initialize()
+    print('Database Intialized!')
+
+'''
+Import Commands
+'''
+
+import_cli = AppGroup('import', help='Bulk Import Commands (Incremental - Does Not Reset The Database)')
+# eg : flask import <students|reviews> <file>
+
+def print_import_progress(stats):
+    print(f"{stats.kind.title()}: {stats.read} Rows Processed ({stats.rate:.0f} Rows/s)")
+
+@import_cli.command("students", help="Imports Students From A CSV File")
+@click.argument("file", type=click.Path(exists=True, dir_okay=False))
+@click.option("--batch-size", type=int, default=None, help="Rows Per Insert Batch")
+def import_students_command(file, batch_size):
+    stats = import_students_csv(file, batch_size, progress=print_import_progress)
+    print(f"Students Imported: {stats.created} Created, {stats.duplicates} Duplicates Skipped, {stats.invalid} Invalid In {stats.elapsed:.2f}s.")
+
+@import_cli.command("reviews", help="Imports Reviews From A CSV File")
+@click.argument("file", type=click.Path(exists=True, dir_okay=False))
+@click.option("--batch-size", type=int, default=None, help="Rows Per Insert Batch")
+def import_reviews_command(file, batch_size):
+    stats = import_reviews_csv(file, batch_size, progress=print_import_progress)
+    print(f"Reviews Imported: {stats.created} Created, {stats.duplicates} Duplicates Skipped, {stats.invalid} Invalid In {stats.elapsed:.2f}s.")
+
+
+'''
+Export Commands
+'''
+
+export_cli = AppGroup('export', help='Export Commands (Streamed - Memory Use Does Not Grow With The Table)')
+# eg : flask export reviews --format <csv|ndjson> [--reviewer ID] [--student ID] [--output FILE]
+
+@export_cli.command("reviews", help="Exports Reviews With Their Reviewer & Student (CSV Is Importable With 'flask import reviews')")
+@click.option("--format", "format", type=click.Choice(EXPORT_FORMATS), default="csv", help="Output Format")
+@click.option("--reviewer", "reviewer_id", type=int, default=None, help="Only Reviews Written By This Staff ID")
+@click.option("--student", "student_id", type=int, default=None, help="Only Reviews Of This Student ID")
+@click.option("--output", type=click.Path(dir_okay=False, allow_dash=True), default="-", help="Output File (Default: stdout)")
+def export_reviews_command(format, reviewer_id, student_id, output):
+    with click.open_file(output, 'wb') as file:
+        for chunk in iter_reviews_export(format, reviewer_id, student_id):
+            file.write(chunk)
+
+
+'''
+Admin Staff Commands
+'''
+
+admin_cli = AppGroup('admin', help='Admin Object Commands') 
+# eg : flask admin <command>
+
+# EXTRA - CREATE STAFF ACCOUNT
+@admin_cli.command("create_staff", help="Creates A Staff Account")
+@click.argument("prefix", required=False)
+@click.argument("firstname", required=False)
+@click.argument("lastname", required=False)
+@click.argument("email", required=False)
+@click.argument("is_admin_input", required=False)
+@click.argument("password", required=False)
+@click.argument("created_by_id", required=False)
+def create_staff_command(prefix, firstname, lastname, email, is_admin_input, password, created_by_id):
+    if prefix is None:
+        prefix = input("Enter Staff Prefix: ")
+    if firstname is None:
+        firstname = input("Enter Staff First Name: ")
+    if lastname is None:
+        lastname = input("Enter Staff Last Name: ")
+    if email is None:
+        email = input("Enter Staff Email: ")
+    if is_admin_input is None:
+        is_admin_input = input("Is This Staff An Admin? (Y/N): ")
+    is_admin = True if is_admin_input.lower() == 'y' else False
+    if password is None:
+        password = input("Enter Staff Default Password: ")
+    if created_by_id is None:
+        created_by_id = input("Enter Your Admin ID: ")
+
+    existing_staff = Staff.query.filter_by(email=email).first()
+
+    if existing_staff:
+        print("ERROR: A Staff Already Exists With That Email.")
+        return
+
+    new_staff = create_staff(prefix, firstname, lastname, email, is_admin, password, created_by_id)
+    if new_staff:
+        print(f'Staff Account For {prefix + " " + firstname + " " + lastname} Created!')
+    else:
+        print("ERROR: Unauthorized - Admins Only.")
+
+# EXTRA - REBUILD THE FULL-TEXT SEARCH INDEX
+@admin_cli.command("rebuild_search_index", help="Creates/Rebuilds The Student & Review Search Index")
+def rebuild_search_index_command():
+    rebuild_search_index()
+    print("Search Index Rebuilt!")
+
+# EXTRA - REFRESH THE PRECOMPUTED LEADERBOARDS
+@admin_cli.command("refresh_leaderboards", help="Folds New Reviews Into The Leaderboards (--full Rebuilds Them)")
+@click.option("--full", is_flag=True, help="Rebuild From Every Review Instead Of Only The New Ones")
+def refresh_leaderboards_command(full):
+    result = refresh_leaderboards(full=full)
+    if result is None:
+        print("Another Process Is Refreshing The Leaderboards.")
+    else:
+        print(f"Leaderboards {'Rebuilt' if result['full'] else 'Refreshed'}: {result['folded']} Reviews Folded In, "
+              f"Up To Review {result['high_water_mark']}.")
+
+
+'''
+Regular Staff Commands
+'''
+
+staff_cli = AppGroup('staff', help='Admin Object Commands') 
+# eg : flask staff <command>
+
+# REQUIREMENT #1 - ADD STUDENT
+@staff_cli.command("add_student", help="Adds A Student Record")
+@click.argument("student_id", required=False)
+@click.argument("firstname", required=False)
+@click.argument("lastname", required=False)
+@click.argument("email", required=False)
+def add_student_command(student_id, firstname, lastname, email):
+    if student_id is None:
+        student_id = input("Enter Student ID: ")
+    if firstname is None:
+        firstname = input("Enter Student First Name: ")
+    if lastname is None:
+        lastname = input("Enter Lastname Last Name: ")
+    if email is None:
+        email = input("Enter Student Email: ")
+    new_student = add_student(student_id, firstname, lastname, email)
+    if new_student:
+        print(f"A Record Has Been Made For Student: {firstname + ' ' + lastname}.")
+    else:
+        print(f"ERROR: A Student With That ID Already Exists In The Database!")
+
+# REQUIREMENT #2 - REVIEW STUDENT
+@staff_cli.command("review", help="Adds A Review To A Student")
+@click.argument("student_id", required=False)
+@click.argument("text", nargs=-1, required=False)  # Used nargs=-1 To Accept Multiple Words As A Single Argument :D
+@click.argument("rating", required=False)
+@click.argument("reviewer_id", required=False)
+def review_student_command(student_id, text, rating, reviewer_id):
+    if student_id is None:
+        student_id = input("Enter Student ID To Review: ")
+
+    if not text:
+        text = input("Enter Review: ")
+    else:
+        text = " ".join(text)
+
+    if rating is None:
+        rating = input("Give A Rating (1-5): ")
+
+    if reviewer_id is None:
+        reviewer_id = input("Input Your Staff ID: ")
+
+    if parse_rating(rating) is None:
+        print(f"ERROR: Rating Must Be A Whole Number From 1 To 5, Not {rating!r}.")
+        return
+
+    review = add_review(student_id, text, rating, reviewer_id)
+    student = get_student(student_id)
+
+    if review and student:
+        print(f"Review Uploaded To Student With ID: {student_id} ({student.firstname} {student.lastname}) Successfully!")
+    else:
+        print(f"ERROR: Student With ID {student_id} Does Not Exist.")
+
+# REQUIREMENT #3 - VIEW STUDENT REVIEWS
+@staff_cli.command("view_student_reviews", help="List All Reviews For Specified Student")
+@click.argument("student_id", required=False)
+@click.argument("format", default="string")
+@click.option("--page-size", type=int, default=None, help="Reviews Fetched Per Page")
+def list_review_command(student_id, format, page_size):
+
+    if not student_id:
+        student_id = input("Enter Student ID: ")    
+
+    if not get_student(student_id):
+        print(f"ERROR: Student With ID {student_id} Does Not Exist.")
+        return
+
+    # Reviews Are Fetched & Printed A Page At A Time
+    total = 0
+    for page in iter_student_reviews_pages_json(student_id, page_size):
+        for review in page['reviews']:
+            if format == "string":
+                print(f"<Review: {review['text']} | Rating: {review['rating']} | Written By: {review['reviewer']}>")
+            else:
+                print(review)
+        total += len(page['reviews'])
+
+    if not total:
+        print(f"Student With ID {student_id} Has No Reviews.")
+
+# REQUIREMENT #4 - SEARCH STUDENT
+@staff_cli.command("search_student", help="Searches For Specific Student")
+@click.argument("student_id", required=False)
+def search_student_command(student_id):
+    if student_id is None:
+        student_id = input("Enter Student ID To Search: ")
+
+    if get_student(student_id):
+        print(get_student(student_id))
+    else:
+        print(f"ERROR: Student With ID {student_id} Does Not Exist.")
+
+# EXTRA - FULL-TEXT SEARCH
+@staff_cli.command("search", help="Searches Students By Name/Email And Review Text")
+@click.argument("query", nargs=-1, required=False)
+@click.option("--type", "search_type", type=click.Choice(['all', *SEARCH_TYPES]), default="all")
+@click.option("--limit", type=int, default=None, help="Results Per Type")
+@click.option("--offset", type=int, default=0)
+def search_command(query, search_type, limit, offset):
+    query = " ".join(query) if query else input("Enter Search Query: ")
+    types = SEARCH_TYPES if search_type == "all" else (search_type,)
+
+    for kind, page in search(query, types, limit, offset).items():
+        print(f"{kind.title()} Matching '{query}':")
+        for result in page['results']:
+            if kind == 'students':
+                print(f"  {result['student_id']} | {result['firstname']} {result['lastname']} | {result['email']}")
+            else:
+                print(f"  Student {result['student_id']} | {result['text']} | Rating: {result['rating']} | {result['reviewer']}")
+        if not page['results']:
+            print("  No Matches.")
+        elif page['next'] is not None:
+            print(f"  More Results: --offset {page['next']}")
+
+
+'''
+Test Commands
+'''
+test = AppGroup('test', help='Testing Commands') 
+
+# pytest Is Only Imported When A Test Command Actually Runs
+def run_pytest(args):
+    import pytest
+    return pytest.main(args)
+
+@test.command("staff", help="Run Staff Tests")
+@click.argument("type", default="all")
+def user_tests_command(type):
+    if type == "unit":
+        sys.exit(run_pytest(["-k", "StaffUnitTests"]))
+    elif type == "int":
+        sys.exit(run_pytest(["-k", "StaffIntegrationTests"]))
+    else:
+        sys.exit(run_pytest(["-k", "App"]))
+
+@test.command("student", help="Run Student tests")
+@click.argument("type", default="all")
+def user_tests_command(type):
+    
+    if type == "unit":
+        sys.exit(run_pytest(["-k", "StudentUnitTests"]))
+    else:
+        sys.exit(run_pytest(["-k", "App"]))
+
+# Registers Every Command Group & Flask-Migrate's `flask db` On The App
+def init_cli(app):
+    app.cli.add_command(init)
+    for group in (import_cli, export_cli, admin_cli, staff_cli, test):
+        app.cli.add_command(group)
+    return get_migrate(app)
@@ -1,10 +1,62 @@
 import os
+from sqlalchemy.engine import URL, make_url
+
+# Pool Settings Passed To create_engine() - Config Key -> Engine Option
+POOL_OPTIONS = {
+    'DB_POOL_SIZE': 'pool_size',
+    'DB_MAX_OVERFLOW': 'max_overflow',
+    'DB_POOL_RECYCLE': 'pool_recycle',
+    'DB_POOL_TIMEOUT': 'pool_timeout',
+    'DB_POOL_PRE_PING': 'pool_pre_ping',
+}
+
+REPLICA_BIND_PREFIX = 'replica_'
+
+# Postgres URL From The POSTGRES_URL/USER/PASSWORD/DB Variables render.yaml Provides (None If They Are Not Set)
+# POSTGRES_URL May Be A Bare Host (Render's `host` Property), A host:port Or A Full postgres:// URL
+# The Driver Is Pinned To psycopg2 (requirements.txt) - Newer SQLAlchemy Defaults postgresql:// To psycopg 3
+def get_postgres_uri(environ=os.environ):
+    location = environ.get('POSTGRES_URL')
+    if not location:
+        return None
+    if '://' in location:
+        url = make_url(location)
+        if url.drivername in ('postgres', 'postgresql'):
+            url = url.set(drivername='postgresql+psycopg2')
+    else:
+        host, _, port = location.partition(':')
+        url = URL.create('postgresql+psycopg2', host=host, port=int(port) if port else None)
+    return url.set(
+        username=environ.get('POSTGRES_USER') or url.username,
+        password=environ.get('POSTGRES_PASSWORD') or url.password,
+        database=environ.get('POSTGRES_DB') or url.database,
+    ).render_as_string(hide_password=False)
+
+# Engine Options For The Configured (Or Given) Database - SQLite Keeps SQLAlchemy's Defaults (Its Pools Take No Sizing)
+def get_engine_options(config, uri=None):
+    options = dict(config.get('SQLALCHEMY_ENGINE_OPTIONS') or {}) if uri is None else {}
+    if make_url(uri or config['SQLALCHEMY_DATABASE_URI']).get_backend_name() == 'sqlite':
+        return options
+    for key, option in POOL_OPTIONS.items():
+        if config.get(key) is not None:
+            options.setdefault(option, config[key])
+    return options
+
+# Read Replicas Become The Binds replica_0, replica_1, ... (See App.database.RoutingSession)
+def get_replica_binds(config):
+    binds = dict(config.get('SQLALCHEMY_BINDS') or {})
+    for index, uri in enumerate(config.get('SQLALCHEMY_REPLICA_URIS') or []):
+        binds[f'{REPLICA_BIND_PREFIX}{index}'] = {'url': uri, **get_engine_options(config, uri)}
+    return binds
 
 def load_config(app, overrides):
     if os.path.exists(os.path.join('./App', 'custom_config.py')):
         app.config.from_object('App.custom_config')
     else:
         app.config.from_object('App.default_config')
+    postgres_uri = get_postgres_uri()
+    if postgres_uri:
+        app.config['SQLALCHEMY_DATABASE_URI'] = postgres_uri
     app.config.from_prefixed_env()
     app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
     app.config['TEMPLATES_AUTO_RELOAD'] = True
@@ -14,6 +66,7 @@ def load_config(app, overrides):
     app.config["JWT_TOKEN_LOCATION"] = ["cookies", "headers"]
     app.config["JWT_COOKIE_SECURE"] = True
     app.config["JWT_COOKIE_CSRF_PROTECT"] = False
-    app.config['FLASK_ADMIN_SWATCH'] = 'darkly'
     for key in overrides:
-        app.config[key] = overrides[key]
\ No newline at end of file
+        app.config[key] = overrides[key]
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = get_engine_options(app.config)
+    app.config['SQLALCHEMY_BINDS'] = get_replica_binds(app.config)
\ No newline at end of file
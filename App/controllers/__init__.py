@@ -1,5 +1,9 @@
 from .staff import *
 from .student import *
 from .review import *
+from .search import *
+from .importer import *
+from .exporter import *
+from .leaderboard import *
 from .initialize import *
 from .auth import *
@@ -1,40 +1,103 @@
-from flask_jwt_extended import create_access_token, jwt_required, JWTManager, get_jwt_identity, verify_jwt_in_request
+import logging
+from flask import has_request_context, request
+from flask_jwt_extended import create_access_token, jwt_required, JWTManager, get_jwt, get_jwt_identity, verify_jwt_in_request
+from werkzeug.local import LocalProxy
+from App.database import db
 from App.models import Staff
+from .staff import get_cached_staff, staff_cache
+
+logger = logging.getLogger(__name__)
 
 def login(email, password):
   staff = Staff.query.filter_by(email=email).first()
   if staff and staff.check_password(password):
+    # transparently upgrade hashes made with an outdated method/cost
+    if staff.password_needs_rehash():
+      staff.set_password(password)
+      db.session.commit()
     return create_access_token(identity=staff.id)
   return None
 
 def setup_jwt(app):
   jwt = JWTManager(app)
+  staff_cache.configure(maxsize=app.config.get('STAFF_CACHE_SIZE'), ttl=app.config.get('STAFF_CACHE_TTL'))
 
   # configure's flask jwt to resolve get_current_identity() to the corresponding staff's ID
   @jwt.user_identity_loader
   def user_identity_lookup(identity):
-    staff = Staff.query.get(identity)
+    staff = get_cached_staff(identity)
     if staff:
         return staff.id
     return None
 
+  # current_user is a read-only StaffSnapshot served from the staff cache
+  # (also shared with the request's RequestAuth so templates don't decode/look it up again)
+  # a token for a staff that no longer exists gets None here, which flask_jwt_extended rejects
   @jwt.user_lookup_loader
   def user_lookup_callback(_jwt_header, jwt_data):
-    identity = jwt_data["sub"]
-    return Staff.query.get(identity)
+    staff = get_cached_staff(jwt_data["sub"])
+    if has_request_context():
+        get_request_auth().remember(jwt_data, staff)
+    return staff
   return jwt
 
+_UNSET = object()
+
+# Request-scoped, lazily evaluated identity - the token is decoded at most once per request
+# (reusing jwt_required's result when the view already verified it), together with the
+# (cached) staff lookup, so a token whose staff has been deleted is not authenticated;
+# nothing happens unless a template reads is_authenticated or current_user
+class RequestAuth:
+  def __init__(self):
+    self._jwt_data = _UNSET
+    self._user = _UNSET
+
+  def remember(self, jwt_data, user):
+    self._jwt_data = jwt_data
+    self._user = user
+
+  @property
+  def jwt_data(self):
+    if self._jwt_data is _UNSET:
+      try:
+        # no token - simply not authenticated
+        self._jwt_data = get_jwt() if verify_jwt_in_request(optional=True) else None
+      except Exception as e:
+        # an expired/invalid one, or one for a deleted staff - also not authenticated
+        # (logged at the LOG_SAMPLE_RATES rate)
+        logger.info("Rejected Token: %s", e)
+        self._jwt_data = None
+        self._user = None
+    return self._jwt_data
+
+  # The Token's Claims If This Request Has Already Decoded Them, Else None (Never Decodes)
+  @property
+  def known_jwt_data(self):
+    return None if self._jwt_data is _UNSET else self._jwt_data
+
+  @property
+  def is_authenticated(self):
+    return self.jwt_data is not None
+
+  @property
+  def current_user(self):
+    if self._user is _UNSET:
+      self._user = get_cached_staff(self.jwt_data["sub"]) if self.jwt_data else None
+    return self._user
+
+def get_request_auth():
+  auth = request.environ.get('app.request_auth')
+  if auth is None:
+    auth = request.environ['app.request_auth'] = RequestAuth()
+  return auth
+
 # Context processor to make 'is_authenticated' available to all templates
+# (both values are lazy proxies, evaluated only if a template reads them)
 def add_auth_context(app):
   @app.context_processor
   def inject_user():
-      try:
-          verify_jwt_in_request()
-          identity = get_jwt_identity()
-          current_user = Staff.query.get(identity)
-          is_authenticated = True
-      except Exception as e:
-          print(e)
-          is_authenticated = False
-          current_user = None
-      return dict(is_authenticated=is_authenticated, current_user=current_user)
\ No newline at end of file
+      if not has_request_context():
+          return dict(is_authenticated=False, current_user=None)
+      auth = get_request_auth()
+      return dict(is_authenticated=LocalProxy(lambda: auth.is_authenticated),
+                  current_user=LocalProxy(lambda: auth.current_user))
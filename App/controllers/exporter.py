@@ -0,0 +1,73 @@
+import csv, io
+from flask import current_app
+from sqlalchemy import select
+from App.database import db
+from App.json_provider import iter_ndjson
+from App.models import Student, Review, Staff
+
+EXPORT_FORMATS = ('csv', 'ndjson')
+
+# The First Four Columns Are Exactly What reviews.csv (& import_reviews_csv) Expects - The Rest Are Ignored On Import
+REVIEW_EXPORT_COLUMNS = (
+    'student_id', 'text', 'rating', 'reviewer_id',
+    'review_id', 'reviewer_prefix', 'reviewer_firstname', 'reviewer_lastname', 'reviewer_email',
+    'student_firstname', 'student_lastname', 'student_email',
+)
+
+def get_export_yield_per():
+    return int(current_app.config.get('STREAM_YIELD_PER', 1000))
+
+# Column-Only Select Of Every Review Joined With Its Reviewer & Student, In Review ID Order
+def select_review_export_rows(reviewer_id=None, student_id=None):
+    statement = select(
+        Review.student_id, Review.text, Review.rating, Review.reviewer_id,
+        Review.id.label('review_id'),
+        Staff.prefix.label('reviewer_prefix'), Staff.firstname.label('reviewer_firstname'),
+        Staff.lastname.label('reviewer_lastname'), Staff.email.label('reviewer_email'),
+        Student.firstname.label('student_firstname'), Student.lastname.label('student_lastname'),
+        Student.email.label('student_email'),
+    ).join(Staff, Review.reviewer_id == Staff.id).join(Student, Review.student_id == Student.student_id)
+    if reviewer_id is not None:
+        statement = statement.where(Review.reviewer_id == reviewer_id)
+    if student_id is not None:
+        statement = statement.where(Review.student_id == student_id)
+    return statement.order_by(Review.id)
+
+# Stream Export Rows As Dicts From A Server-Side Cursor - Only `yield_per` Rows Are Held In Memory At Once
+def iter_review_export_rows(reviewer_id=None, student_id=None, yield_per=None):
+    rows = db.session.execute(
+        select_review_export_rows(reviewer_id, student_id)
+        .execution_options(yield_per=yield_per or get_export_yield_per())
+    )
+    for row in rows:
+        yield row._asdict()
+
+# The CSV Importer Reads Files As 'unicode_escape', So Text Is Written Escaped (Pure ASCII, One Line Per Review)
+def _csv_value(value):
+    return value.encode('unicode_escape').decode('ascii') if isinstance(value, str) else value
+
+# Stream The Export As Semicolon Delimited, Fully Quoted CSV Lines (Header First, ASCII Bytes) - Same Format As reviews.csv
+def iter_reviews_csv(reviewer_id=None, student_id=None, yield_per=None):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, delimiter=';', quoting=csv.QUOTE_ALL, lineterminator='\n')
+
+    def flush():
+        line = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return line.encode('ascii')
+
+    writer.writerow(REVIEW_EXPORT_COLUMNS)
+    yield flush()
+    for row in iter_review_export_rows(reviewer_id, student_id, yield_per):
+        writer.writerow([_csv_value(row[column]) for column in REVIEW_EXPORT_COLUMNS])
+        yield flush()
+
+# Stream The Export As NDJSON - One Compact JSON Object Per Line (UTF-8 Bytes)
+def iter_reviews_ndjson(reviewer_id=None, student_id=None, yield_per=None):
+    return iter_ndjson(iter_review_export_rows(reviewer_id, student_id, yield_per))
+
+# Stream The Review Export In The Given Format (One Of EXPORT_FORMATS)
+def iter_reviews_export(format='csv', reviewer_id=None, student_id=None, yield_per=None):
+    exporters = {'csv': iter_reviews_csv, 'ndjson': iter_reviews_ndjson}
+    return exporters[format](reviewer_id, student_id, yield_per)
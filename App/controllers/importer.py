@@ -0,0 +1,264 @@
+import csv, logging, time
+from itertools import islice
+from flask import current_app
+from sqlalchemy import insert, select
+from App.database import db
+from App.models import Student, Review, Staff
+from .student import is_valid_student_id
+from .review import parse_rating, refresh_rating_summaries, bump_student_versions
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_IMPORT_BATCH_SIZE = 1000
+
+CREATED = 'created'
+DUPLICATE = 'duplicate'
+INVALID = 'invalid'
+NOT_FOUND = 'not_found'
+FAILED = 'failed'
+
+# Raised By bulk_add_students Once A Stream Has More Than max_rows Rows - `results` Holds The Rows Already Handled
+class RowLimitExceeded(Exception):
+    def __init__(self, max_rows, results):
+        super().__init__(f"More Than {max_rows} Rows")
+        self.max_rows = max_rows
+        self.results = results
+
+# Import Progress & Throughput
+class ImportStats:
+    def __init__(self, kind):
+        self.kind = kind
+        self.read = 0
+        self.created = 0
+        self.duplicates = 0
+        self.invalid = 0
+        self.started = time.perf_counter()
+
+    def add(self, statuses):
+        self.read += len(statuses)
+        self.created += statuses.count(CREATED)
+        self.duplicates += statuses.count(DUPLICATE)
+        self.invalid += statuses.count(INVALID)
+
+    @property
+    def elapsed(self):
+        return time.perf_counter() - self.started
+
+    @property
+    def rate(self):
+        return self.read / self.elapsed if self.elapsed else 0.0
+
+    def __repr__(self):
+        return (f"<Import {self.kind}: {self.read} Read | {self.created} Created | {self.duplicates} Duplicates | "
+                f"{self.invalid} Invalid | {self.elapsed:.2f}s ({self.rate:.0f} Rows/s)>")
+
+def get_import_batch_size(batch_size=None):
+    if batch_size:
+        return int(batch_size)
+    return int(current_app.config.get('IMPORT_BATCH_SIZE', DEFAULT_IMPORT_BATCH_SIZE))
+
+# Split Any Row Iterable Into Lists Of At Most `size` Rows Without Materializing It
+def chunked(rows, size):
+    rows = iter(rows)
+    while True:
+        chunk = list(islice(rows, size))
+        if not chunk:
+            return
+        yield chunk
+
+# Stream Rows From A Semicolon Delimited CSV (The Format Of students.csv & reviews.csv)
+def read_csv_rows(path, encoding='unicode_escape'):
+    with open(path, encoding=encoding, newline='') as csvfile:
+        for row in csv.DictReader(csvfile, delimiter=';'):
+            yield row
+
+def _to_int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+# Insert A Chunk Of Students - One IN Query Per Key & One Multi-Row Insert
+# The Keys Of Created Rows Go Into new_ids/new_emails (Default: Straight Into seen_ids/seen_emails)
+def insert_students_chunk(rows, seen_ids=None, seen_emails=None, new_ids=None, new_emails=None):
+    seen_ids = set() if seen_ids is None else seen_ids
+    seen_emails = set() if seen_emails is None else seen_emails
+    new_ids = seen_ids if new_ids is None else new_ids
+    new_emails = seen_emails if new_emails is None else new_emails
+
+    parsed = []
+    for row in rows:
+        if not isinstance(row, dict):
+            parsed.append(None)
+            continue
+        student_id = _to_int(row.get('student_id'))
+        firstname, lastname, email = row.get('firstname'), row.get('lastname'), row.get('email')
+        if not student_id or not firstname or not lastname or not email or not is_valid_student_id(student_id):
+            parsed.append(None)
+        else:
+            parsed.append({'student_id': student_id, 'firstname': firstname, 'lastname': lastname, 'email': email})
+
+    ids = {row['student_id'] for row in parsed if row}
+    emails = {row['email'] for row in parsed if row}
+    existing_ids = set(db.session.scalars(select(Student.student_id).where(Student.student_id.in_(ids)))) if ids else set()
+    existing_emails = set(db.session.scalars(select(Student.email).where(Student.email.in_(emails)))) if emails else set()
+
+    statuses, new_rows = [], []
+    for row in parsed:
+        if row is None:
+            statuses.append(INVALID)
+        elif row['student_id'] in existing_ids or row['student_id'] in seen_ids or row['student_id'] in new_ids \
+                or row['email'] in existing_emails or row['email'] in seen_emails or row['email'] in new_emails:
+            statuses.append(DUPLICATE)
+        else:
+            new_ids.add(row['student_id'])
+            new_emails.add(row['email'])
+            new_rows.append(row)
+            statuses.append(CREATED)
+
+    if new_rows:
+        db.session.execute(insert(Student.__table__), new_rows)
+    return statuses
+
+# Insert A Chunk Of Reviews - Skips Unknown Students/Reviewers, Ratings Outside RATING_VALUES & Reviews Already Recorded
+# The Rating Summaries & Versions Of The Students Reviewed Are Updated In The Same Transaction
+def insert_reviews_chunk(rows, seen_keys=None, known_reviewers=None):
+    seen_keys = set() if seen_keys is None else seen_keys
+    known_reviewers = set() if known_reviewers is None else known_reviewers
+
+    parsed = []
+    for row in rows:
+        if not isinstance(row, dict):
+            parsed.append(None)
+            continue
+        student_id = _to_int(row.get('student_id'))
+        reviewer_id = _to_int(row.get('reviewer_id'))
+        rating = parse_rating(row.get('rating'))
+        text = row.get('text')
+        if not student_id or not reviewer_id or not text or rating is None:
+            parsed.append(None)
+        else:
+            parsed.append({'student_id': student_id, 'reviewer_id': reviewer_id, 'text': text, 'rating': rating})
+
+    student_ids = {row['student_id'] for row in parsed if row}
+    reviewer_ids = {row['reviewer_id'] for row in parsed if row} - known_reviewers
+    existing_students = set(db.session.scalars(select(Student.student_id).where(Student.student_id.in_(student_ids)))) if student_ids else set()
+    if reviewer_ids:
+        known_reviewers.update(db.session.scalars(select(Staff.id).where(Staff.id.in_(reviewer_ids))))
+    existing_keys = {tuple(key) for key in db.session.execute(
+        select(Review.student_id, Review.reviewer_id, Review.text).where(Review.student_id.in_(existing_students))
+    )} if existing_students else set()
+
+    statuses, new_rows = [], []
+    for row in parsed:
+        if row is None or row['student_id'] not in existing_students or row['reviewer_id'] not in known_reviewers:
+            statuses.append(INVALID)
+            continue
+        key = (row['student_id'], row['reviewer_id'], row['text'])
+        if key in existing_keys or key in seen_keys:
+            statuses.append(DUPLICATE)
+        else:
+            seen_keys.add(key)
+            new_rows.append(row)
+            statuses.append(CREATED)
+
+    if new_rows:
+        db.session.execute(insert(Review.__table__), new_rows)
+        reviewed = {row['student_id'] for row in new_rows}
+        refresh_rating_summaries(reviewed)
+        bump_student_versions(reviewed)
+    return statuses
+
+def _run_import(kind, rows, insert_chunk, batch_size, progress, **seen):
+    stats = ImportStats(kind)
+    try:
+        for chunk in chunked(rows, get_import_batch_size(batch_size)):
+            stats.add(insert_chunk(chunk, **seen))
+            db.session.commit()
+            if progress:
+                progress(stats)
+    except Exception:
+        db.session.rollback()
+        raise
+    return stats
+
+# Import Students (Incremental - Existing Students Are Skipped)
+def import_students(rows, batch_size=None, progress=None):
+    return _run_import('students', rows, insert_students_chunk, batch_size, progress,
+                       seen_ids=set(), seen_emails=set())
+
+# Import Reviews (Incremental - Reviews Already Recorded Are Skipped)
+def import_reviews(rows, batch_size=None, progress=None):
+    return _run_import('reviews', rows, insert_reviews_chunk, batch_size, progress,
+                       seen_keys=set(), known_reviewers=set())
+
+# Add Many Students - Chunked, One Commit Per Chunk, A Result For Every Row (Never Stops Early)
+# A Chunk's Keys Only Count As Seen Once It Has Committed, So Rows Repeating A Failed Chunk's Keys Can Still Be Created
+# With max_rows, A Chunk That Would Take The Total Past It Is Not Added - RowLimitExceeded Is Raised Instead
+# (Rows Are Still Streamed, So The Chunks Before It Have Already Been Committed)
+def bulk_add_students(rows, batch_size=None, max_rows=None):
+    results, seen_ids, seen_emails, index = [], set(), set(), 0
+    for chunk in chunked(rows, get_import_batch_size(batch_size)):
+        if max_rows is not None and index + len(chunk) > max_rows:
+            raise RowLimitExceeded(max_rows, results)
+        chunk_ids, chunk_emails = set(), set()
+        try:
+            statuses = insert_students_chunk(chunk, seen_ids, seen_emails, chunk_ids, chunk_emails)
+            db.session.commit()
+            seen_ids.update(chunk_ids)
+            seen_emails.update(chunk_emails)
+        except Exception as e:
+            logger.exception("Error While Adding Students: %s", e)
+            db.session.rollback()
+            statuses = [FAILED] * len(chunk)
+        for row, status in zip(chunk, statuses):
+            student_id = row.get('student_id') if isinstance(row, dict) else None
+            results.append({'index': index, 'student_id': student_id, 'status': status})
+            index += 1
+    return results
+
+# Add Many Reviews By One Reviewer - One Student Lookup, Batched Inserts & A Single Transaction
+# Returns A Result For Every Item: created, invalid (bad fields Or a rating outside RATING_VALUES) Or not_found (unknown student)
+def bulk_add_reviews(items, reviewer_id, batch_size=None):
+    parsed = []
+    for item in items:
+        student_id = _to_int(item.get('student_id')) if isinstance(item, dict) else None
+        rating = parse_rating(item.get('rating')) if isinstance(item, dict) else None
+        text = item.get('text') if isinstance(item, dict) else None
+        if not student_id or not is_valid_student_id(student_id) or not text or not isinstance(text, str) or rating is None:
+            parsed.append(None)
+        else:
+            parsed.append({'student_id': student_id, 'reviewer_id': reviewer_id, 'text': text, 'rating': rating})
+
+    student_ids = {row['student_id'] for row in parsed if row}
+    existing = set(db.session.scalars(select(Student.student_id).where(Student.student_id.in_(student_ids)))) if student_ids else set()
+
+    results, new_rows = [], []
+    for index, (item, row) in enumerate(zip(items, parsed)):
+        student_id = item.get('student_id') if isinstance(item, dict) else None
+        if row is None:
+            status = INVALID
+        elif row['student_id'] not in existing:
+            status = NOT_FOUND
+        else:
+            status = CREATED
+            new_rows.append(row)
+        results.append({'index': index, 'student_id': student_id, 'status': status})
+
+    try:
+        for chunk in chunked(new_rows, get_import_batch_size(batch_size)):
+            db.session.execute(insert(Review.__table__), chunk)
+        reviewed = {row['student_id'] for row in new_rows}
+        refresh_rating_summaries(reviewed)
+        bump_student_versions(reviewed)
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+    return results
+
+def import_students_csv(path, batch_size=None, progress=None):
+    return import_students(read_csv_rows(path), batch_size, progress)
+
+def import_reviews_csv(path, batch_size=None, progress=None):
+    return import_reviews(read_csv_rows(path), batch_size, progress)
@@ -0,0 +1,237 @@
+import bisect
+from datetime import datetime, timezone
+from flask import current_app
+from sqlalchemy import Float, bindparam, cast, delete, func, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from App.database import db
+from App.models import Review, RatingSummary, Staff, Student, ReviewerStats, LeaderboardEntry, LeaderboardState
+
+# Precomputed Leaderboards - Top/Bottom Rated Students, Most Active Reviewers & Percentile Cutoffs
+# refresh_leaderboards() (Run By The Background Refresher & `flask admin refresh_leaderboards`) Folds Reviews
+# Newer Than The High Water Mark Into reviewer_stats, Then Re-Ranks Into leaderboard_entry; Reads Only Touch
+# Those Small Tables, However Many Reviews There Are
+
+STATE_ID = 1
+STUDENT_BOARDS = ('top_students', 'bottom_students')
+PERCENTILE_METRICS = ('student_average', 'reviewer_review_count')
+DEFAULT_PERCENTILES = (10, 25, 50, 75, 90, 99)
+
+def utcnow():
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+# Nearest-Rank Cutoffs For p0..p100 Of Sorted Values (None Without Values)
+def percentile_cutoffs(values):
+    if not values:
+        return None
+    last = len(values) - 1
+    return [values[round(last * p / 100)] for p in range(101)]
+
+# The Percentile (0-100) A Value Falls At - The Highest Cutoff It Reaches
+def percentile_rank(cutoffs, value):
+    return max(bisect.bisect_right(cutoffs, value) - 1, 0)
+
+def _student_average():
+    summary = RatingSummary.__table__.c
+    return cast(summary.rating_sum, Float) / summary.review_count
+
+# Add The Reviews With after < id <= upto To Their Reviewers' Stats - Returns How Many (No Commit)
+def fold_reviews(after, upto):
+    review = Review.__table__.c
+    stats = ReviewerStats.__table__
+    rows = db.session.execute(
+        select(review.reviewer_id, func.count(), func.sum(review.rating))
+        .where(review.id > after, review.id <= upto)
+        .group_by(review.reviewer_id)
+    ).all()
+    if not rows:
+        return 0
+
+    existing = set(db.session.scalars(select(stats.c.staff_id).where(stats.c.staff_id.in_([row[0] for row in rows]))))
+    updates = [{'b_staff_id': staff_id, 'b_count': count, 'b_sum': rating_sum}
+               for staff_id, count, rating_sum in rows if staff_id in existing]
+    inserts = [{'staff_id': staff_id, 'review_count': count, 'rating_sum': rating_sum}
+               for staff_id, count, rating_sum in rows if staff_id not in existing]
+    if updates:
+        db.session.execute(update(stats).where(stats.c.staff_id == bindparam('b_staff_id'))
+                           .values(review_count=stats.c.review_count + bindparam('b_count'),
+                                   rating_sum=stats.c.rating_sum + bindparam('b_sum')), updates)
+    if inserts:
+        db.session.execute(insert(stats), inserts)
+    return sum(row[1] for row in rows)
+
+# Recompute Every Reviewer's Stats From The Reviews With id <= upto - Returns How Many (No Commit)
+def rebuild_reviewer_stats(upto):
+    review = Review.__table__.c
+    stats = ReviewerStats.__table__
+    db.session.execute(delete(stats))
+    db.session.execute(insert(stats).from_select(
+        ['staff_id', 'review_count', 'rating_sum'],
+        select(review.reviewer_id, func.count(), func.sum(review.rating))
+        .where(review.id <= upto)
+        .group_by(review.reviewer_id)
+    ))
+    return db.session.scalar(select(func.coalesce(func.sum(stats.c.review_count), 0)))
+
+# Re-Rank The Top `size` Of Every Board (Students Need `min_reviews` Reviews To Be Ranked) (No Commit)
+def rank_leaderboards(size, min_reviews):
+    summary = RatingSummary.__table__.c
+    stats = ReviewerStats.__table__.c
+    average = _student_average()
+    rated = select(summary.student_id, summary.review_count, summary.rating_sum).where(summary.review_count >= min_reviews)
+    queries = {
+        'top_students': rated.order_by(average.desc(), summary.review_count.desc(), summary.student_id),
+        'bottom_students': rated.order_by(average, summary.review_count.desc(), summary.student_id),
+        'active_reviewers': select(stats.staff_id, stats.review_count, stats.rating_sum)
+                            .where(stats.review_count > 0).order_by(stats.review_count.desc(), stats.staff_id),
+    }
+    db.session.execute(delete(LeaderboardEntry.__table__))
+    for board, query in queries.items():
+        rows = db.session.execute(query.limit(size)).all()
+        if rows:
+            db.session.execute(insert(LeaderboardEntry.__table__), [
+                {'board': board, 'rank': rank, 'subject_id': subject_id, 'review_count': count, 'rating_sum': rating_sum}
+                for rank, (subject_id, count, rating_sum) in enumerate(rows, 1)])
+
+def compute_percentiles(min_reviews):
+    summary = RatingSummary.__table__.c
+    stats = ReviewerStats.__table__.c
+    average = _student_average()
+    averages = db.session.scalars(select(average).where(summary.review_count >= min_reviews).order_by(average)).all()
+    counts = db.session.scalars(select(stats.review_count).where(stats.review_count > 0).order_by(stats.review_count)).all()
+    return {
+        'student_average': percentile_cutoffs([round(value, 4) for value in averages]),
+        'reviewer_review_count': percentile_cutoffs(counts),
+    }
+
+# Bring The Leaderboards Up To The Latest Review - Incremental From The High Water Mark, Or Rebuilt From
+# Scratch With full=True, On The First Run & Every LEADERBOARD_REBUILD_INTERVAL Seconds (Which Also Picks Up
+# Reviews Whose Transactions Committed After A Later ID Had Been Folded In). The High Water Mark Is Advanced
+# With A Compare-And-Set, So Refreshers In Several Processes Never Fold The Same Reviews Twice.
+# Returns What Was Done (None If Another Refresher Got There First)
+def refresh_leaderboards(full=False):
+    config = current_app.config
+    state = LeaderboardState.__table__
+    upto = db.session.scalar(select(func.coalesce(func.max(Review.id), 0)))
+    current = db.session.execute(select(state.c.high_water_mark, state.c.rebuilt_at).where(state.c.id == STATE_ID)).first()
+    now = utcnow()
+
+    try:
+        if current is None:
+            db.session.execute(insert(state), [{'id': STATE_ID, 'high_water_mark': upto, 'refreshed_at': now, 'rebuilt_at': now}])
+            full = True
+        else:
+            rebuild_interval = config.get('LEADERBOARD_REBUILD_INTERVAL', 3600)
+            full = full or bool(rebuild_interval and (current.rebuilt_at is None
+                                                      or (now - current.rebuilt_at).total_seconds() >= rebuild_interval))
+            if current.high_water_mark >= upto and not full:
+                db.session.execute(update(state).where(state.c.id == STATE_ID).values(refreshed_at=now))
+                db.session.commit()
+                return {'full': False, 'folded': 0, 'high_water_mark': current.high_water_mark}
+
+            claimed = db.session.execute(
+                update(state).where(state.c.id == STATE_ID, state.c.high_water_mark == current.high_water_mark)
+                .values(high_water_mark=upto, refreshed_at=now, **({'rebuilt_at': now} if full else {})))
+            if claimed.rowcount == 0:
+                db.session.rollback()
+                return None
+
+        folded = rebuild_reviewer_stats(upto) if full else fold_reviews(current.high_water_mark, upto)
+        min_reviews = config.get('LEADERBOARD_MIN_REVIEWS', 3)
+        rank_leaderboards(config.get('LEADERBOARD_SIZE', 100), min_reviews)
+        db.session.execute(update(state).where(state.c.id == STATE_ID).values(percentiles=compute_percentiles(min_reviews)))
+        db.session.commit()
+    except IntegrityError:
+        # Another Process Created The State Row First - It Is Building The Leaderboards
+        db.session.rollback()
+        return None
+    return {'full': full, 'folded': folded, 'high_water_mark': upto}
+
+def _state():
+    state = LeaderboardState.__table__.c
+    return db.session.execute(select(state.high_water_mark, state.refreshed_at, state.percentiles)
+                              .where(state.id == STATE_ID)).first()
+
+# When The Leaderboards Were Refreshed & How Far Behind The Review Table They Are
+def leaderboard_freshness(state):
+    latest = db.session.scalar(select(func.coalesce(func.max(Review.id), 0)))
+    if state is None or state.refreshed_at is None:
+        return {'refreshed_at': None, 'age_seconds': None, 'high_water_mark': 0,
+                'latest_review_id': latest, 'reviews_behind': latest, 'stale': True}
+    age = (utcnow() - state.refreshed_at).total_seconds()
+    return {
+        'refreshed_at': state.refreshed_at.isoformat() + 'Z',
+        'age_seconds': round(age, 3),
+        'high_water_mark': state.high_water_mark,
+        'latest_review_id': latest,
+        'reviews_behind': max(latest - state.high_water_mark, 0), # Upper Bound - Review IDs Can Have Gaps
+        'stale': age > current_app.config.get('LEADERBOARD_STALE_AFTER', 180),
+    }
+
+# Get The First `limit` Entries Of A Board (JSON) With The Student's Or Reviewer's Name
+def get_leaderboard_json(board, limit=10):
+    entry = LeaderboardEntry.__table__.c
+    if board in STUDENT_BOARDS:
+        subject = Student.__table__
+        columns, key = [subject.c.firstname, subject.c.lastname], 'student_id'
+        join_on = subject.c.student_id == entry.subject_id
+    else:
+        subject = Staff.__table__
+        columns, key = [subject.c.prefix, subject.c.firstname, subject.c.lastname], 'staff_id'
+        join_on = subject.c.id == entry.subject_id
+
+    rows = db.session.execute(
+        select(entry.rank, entry.subject_id, entry.review_count, entry.rating_sum, *columns)
+        .outerjoin(subject, join_on)
+        .where(entry.board == board, entry.rank <= limit)
+        .order_by(entry.rank)
+    ).all()
+    entries = [dict({key: row.subject_id, **{column.name: getattr(row, column.name) for column in columns}},
+                    **LeaderboardEntry.row_json(row)) for row in rows]
+    return {'board': board, 'entries': entries, 'freshness': leaderboard_freshness(_state())}
+
+# Get The Requested Percentile Cutoffs Of Every Metric (JSON) - None For A Metric With No Data Yet
+def get_leaderboard_percentiles_json(percentiles=DEFAULT_PERCENTILES):
+    state = _state()
+    cutoffs = (state.percentiles if state is not None else None) or {}
+    return {
+        'percentiles': {metric: {f'p{p}': cutoffs[metric][p] for p in percentiles} if cutoffs.get(metric) else None
+                        for metric in PERCENTILE_METRICS},
+        'freshness': leaderboard_freshness(state),
+    }
+
+# Get Where A Student's Average Rating Stands (JSON) - None If The Student Does Not Exist
+def get_student_standing_json(student_id):
+    summary = RatingSummary.__table__.c
+    row = db.session.execute(
+        select(Student.student_id, summary.review_count, summary.rating_sum)
+        .outerjoin(RatingSummary, RatingSummary.student_id == Student.student_id)
+        .where(Student.student_id == student_id)
+    ).first()
+    if row is None:
+        return None
+    count = row.review_count or 0
+    average = round(row.rating_sum / count, 4) if count else None
+    ranked = count >= current_app.config.get('LEADERBOARD_MIN_REVIEWS', 3)
+    return _standing_json({'student_id': student_id, 'review_count': count,
+                           'average': round(average, 2) if average is not None else None},
+                          'student_average', average if ranked else None)
+
+# Get Where A Reviewer's Review Count Stands (JSON) - None If The Staff Does Not Exist
+def get_reviewer_standing_json(staff_id):
+    stats = ReviewerStats.__table__.c
+    row = db.session.execute(
+        select(Staff.id, stats.review_count)
+        .outerjoin(ReviewerStats, ReviewerStats.staff_id == Staff.id)
+        .where(Staff.id == staff_id)
+    ).first()
+    if row is None:
+        return None
+    count = row.review_count or 0
+    return _standing_json({'staff_id': staff_id, 'review_count': count}, 'reviewer_review_count', count or None)
+
+def _standing_json(standing, metric, value):
+    state = _state()
+    cutoffs = ((state.percentiles if state is not None else None) or {}).get(metric)
+    standing['percentile'] = percentile_rank(cutoffs, value) if cutoffs and value is not None else None
+    standing['freshness'] = leaderboard_freshness(state)
+    return standing
@@ -1,9 +1,107 @@
+from sqlalchemy import case, delete, func, insert, select, update
 from App.database import db
-from App.models import Review
+from App.models import Review, RatingSummary, Student, RATING_VALUES
 
-# Add A Review
+# A Rating From User Input As An int - None Unless It Is One Of RATING_VALUES
+def parse_rating(rating):
+    try:
+        rating = int(rating)
+    except (TypeError, ValueError):
+        return None
+    return rating if rating in RATING_VALUES else None
+
+# Add A Review - The Student's Rating Summary Is Updated In The Same Transaction (None If The Rating Is Invalid)
 def add_review(student_id, text, rating, reviewer_id):
+    rating = parse_rating(rating)
+    if rating is None:
+        return None
     student_review = Review(student_id=student_id, text=text, rating=rating, reviewer_id=reviewer_id)
     db.session.add(student_review)
+    record_rating(student_id, rating)
+    bump_student_versions([student_id])
     db.session.commit()
-    return student_review
\ No newline at end of file
+    return student_review
+
+# Bump The Version (ETag) Of Students Whose Reviews Changed (No Commit)
+def bump_student_versions(student_ids):
+    student_ids = list(student_ids)
+    if student_ids:
+        student = Student.__table__.c
+        db.session.execute(update(Student.__table__).where(student.student_id.in_(student_ids))
+                           .values(version=student.version + 1))
+
+# INSERT ... ON CONFLICT For The Primary's Dialect (Postgres & SQLite), None If It Has No Such Statement
+def upsert_insert(table):
+    dialect = db.session.get_bind().dialect.name
+    if dialect == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    elif dialect == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    else:
+        return None
+    return dialect_insert(table)
+
+# Fold One New (Valid) Rating Into A Student's Summary (No Commit)
+# A Single Upsert, So Two First Reviews Of A Student Arriving Together Cannot Both Insert The Summary Row
+def record_rating(student_id, rating):
+    summary = RatingSummary.__table__.c
+    values = {
+        'review_count': summary.review_count + 1,
+        'rating_sum': summary.rating_sum + rating,
+        'rating_min': case((summary.rating_min <= rating, summary.rating_min), else_=rating),
+        'rating_max': case((summary.rating_max >= rating, summary.rating_max), else_=rating),
+    }
+    bucket = RatingSummary.histogram_column(rating)
+    values[bucket] = summary[bucket] + 1
+    row = {'student_id': student_id, 'review_count': 1, 'rating_sum': rating, 'rating_min': rating, 'rating_max': rating}
+    row.update({f'rating_{value}': int(value == rating) for value in RATING_VALUES})
+
+    upsert = upsert_insert(RatingSummary.__table__)
+    if upsert is not None:
+        db.session.execute(upsert.values(row).on_conflict_do_update(index_elements=[summary.student_id], set_=values))
+        return
+
+    result = db.session.execute(update(RatingSummary.__table__).where(summary.student_id == student_id).values(values))
+    if result.rowcount == 0:
+        db.session.execute(insert(RatingSummary.__table__), [row])
+
+# Recompute Rating Summaries From The Review Table - For Bulk Writes & Backfills (No Commit)
+def refresh_rating_summaries(student_ids=None):
+    review = Review.__table__.c
+    summary = RatingSummary.__table__
+    aggregates = select(
+        review.student_id,
+        func.count(),
+        func.sum(review.rating),
+        func.min(review.rating),
+        func.max(review.rating),
+        *[func.sum(case((review.rating == value, 1), else_=0)) for value in RATING_VALUES],
+    ).group_by(review.student_id)
+    clear = delete(summary)
+
+    if student_ids is not None:
+        student_ids = list(student_ids)
+        if not student_ids:
+            return
+        aggregates = aggregates.where(review.student_id.in_(student_ids))
+        clear = clear.where(summary.c.student_id.in_(student_ids))
+
+    columns = ['student_id', 'review_count', 'rating_sum', 'rating_min', 'rating_max'] + \
+              [f'rating_{value}' for value in RATING_VALUES]
+    db.session.execute(clear)
+    db.session.execute(insert(summary).from_select(columns, aggregates))
+
+# Summary Columns For Column-Only Selects (Outer Joined Rows Are All None Before The First Review)
+def rating_summary_columns():
+    return [column for column in RatingSummary.__table__.c if column.name != 'student_id']
+
+# Get A Student's Rating Summary (JSON) - One Lookup, None If The Student Does Not Exist
+def get_rating_summary_json(student_id):
+    row = db.session.execute(
+        select(Student.student_id, *rating_summary_columns())
+        .outerjoin(RatingSummary, RatingSummary.student_id == Student.student_id)
+        .where(Student.student_id == student_id)
+    ).first()
+    if not row:
+        return None
+    return dict(student_id=row.student_id, **RatingSummary.row_json(row))
@@ -0,0 +1,110 @@
+import re
+from flask import current_app
+from sqlalchemy import select, text
+from App.database import db
+from App.models import Student, Review, Staff, STUDENT_DOCUMENT, create_search_index
+
+SEARCH_TYPES = ('students', 'reviews')
+
+def get_search_page_size(limit=None):
+    max_size = current_app.config.get('SEARCH_MAX_PAGE_SIZE', 100)
+    if limit is None:
+        limit = current_app.config.get('SEARCH_PAGE_SIZE', 20)
+    return max(1, min(int(limit), max_size))
+
+# Words In The Query - Every Word Must Match, As A Prefix
+def search_terms(query):
+    return re.findall(r'\w+', query or '')
+
+def _fts5_query(terms):
+    return ' '.join(f'"{term}"*' for term in terms)
+
+def _tsquery(terms):
+    return ' & '.join(f"{term}:*" for term in terms)
+
+def _student_json(row):
+    return {
+        'student_id': row.student_id,
+        'firstname': row.firstname,
+        'lastname': row.lastname,
+        'email': row.email,
+    }
+
+def _review_json(row):
+    return dict(id=row.id, **Review.row_json(row))
+
+# One Page Of Ranked Matches Plus The Offset Of The Next Page (None On The Last Page)
+def _page(rows, limit, offset, to_json):
+    rows = list(rows)
+    next_offset = offset + limit if len(rows) > limit else None
+    return {'results': [to_json(row) for row in rows[:limit]], 'next': next_offset}
+
+# Search Students By (Partial) Name Or Email
+def search_students(query, limit=None, offset=0):
+    limit, terms = get_search_page_size(limit), search_terms(query)
+    if not terms:
+        return {'results': [], 'next': None}
+    columns = 'student.student_id, student.firstname, student.lastname, student.email'
+    params = {'limit': limit + 1, 'offset': offset}
+    dialect = db.engine.dialect.name
+
+    if dialect == 'sqlite':
+        statement = text(f"""SELECT {columns} FROM student_fts JOIN student ON student.student_id = student_fts.rowid
+                             WHERE student_fts MATCH :match ORDER BY bm25(student_fts), student.student_id
+                             LIMIT :limit OFFSET :offset""")
+        params['match'] = _fts5_query(terms)
+    elif dialect == 'postgresql':
+        statement = text(f"""SELECT {columns} FROM student, to_tsquery('simple', :tsquery) AS query
+                             WHERE to_tsvector('simple', {STUDENT_DOCUMENT}) @@ query OR ({STUDENT_DOCUMENT}) ILIKE :like
+                             ORDER BY ts_rank(to_tsvector('simple', {STUDENT_DOCUMENT}), query)
+                                      + similarity({STUDENT_DOCUMENT}, :raw) DESC, student.student_id
+                             LIMIT :limit OFFSET :offset""")
+        params.update(tsquery=_tsquery(terms), like=f"%{' '.join(terms)}%", raw=' '.join(terms))
+    else:
+        # Unindexed Fallback For Other Databases
+        document = Student.firstname + ' ' + Student.lastname + ' ' + Student.email
+        statement = select(Student.student_id, Student.firstname, Student.lastname, Student.email) \
+            .where(*[document.ilike(f'%{term}%') for term in terms]) \
+            .order_by(Student.student_id).limit(limit + 1).offset(offset)
+        params = {}
+    return _page(db.session.execute(statement, params), limit, offset, _student_json)
+
+# Search Review Text
+def search_reviews(query, limit=None, offset=0):
+    limit, terms = get_search_page_size(limit), search_terms(query)
+    if not terms:
+        return {'results': [], 'next': None}
+    columns = 'review.id, review.student_id, review.text, review.rating, staff.prefix, staff.firstname, staff.lastname'
+    params = {'limit': limit + 1, 'offset': offset}
+    dialect = db.engine.dialect.name
+
+    if dialect == 'sqlite':
+        statement = text(f"""SELECT {columns} FROM review_fts JOIN review ON review.id = review_fts.rowid
+                             JOIN staff ON staff.id = review.reviewer_id
+                             WHERE review_fts MATCH :match ORDER BY bm25(review_fts), review.id
+                             LIMIT :limit OFFSET :offset""")
+        params['match'] = _fts5_query(terms)
+    elif dialect == 'postgresql':
+        statement = text(f"""SELECT {columns} FROM review JOIN staff ON staff.id = review.reviewer_id,
+                             to_tsquery('english', :tsquery) AS query
+                             WHERE to_tsvector('english', review.text) @@ query
+                             ORDER BY ts_rank(to_tsvector('english', review.text), query) DESC, review.id
+                             LIMIT :limit OFFSET :offset""")
+        params['tsquery'] = _tsquery(terms)
+    else:
+        statement = select(Review.id, Review.student_id, Review.text, Review.rating, Staff.prefix, Staff.firstname, Staff.lastname) \
+            .join(Staff, Review.reviewer_id == Staff.id) \
+            .where(*[Review.text.ilike(f'%{term}%') for term in terms]) \
+            .order_by(Review.id).limit(limit + 1).offset(offset)
+        params = {}
+    return _page(db.session.execute(statement, params), limit, offset, _review_json)
+
+# Search Students And/Or Reviews - Returns A Ranked Page Per Type
+def search(query, types=SEARCH_TYPES, limit=None, offset=0):
+    searches = {'students': search_students, 'reviews': search_reviews}
+    return {kind: searches[kind](query, limit, offset) for kind in types}
+
+# Rebuild The Search Index From The Student & Review Tables (e.g. After Restoring A Backup)
+def rebuild_search_index():
+    create_search_index(db.session.connection(), rebuild=True)
+    db.session.commit()
@@ -1,5 +1,14 @@
-from App.database import db
-from App.models import Staff
+import logging
+from sqlalchemy import event, inspect, select, update
+from sqlalchemy.orm import Session, joinedload
+from App.cache import TTLCache
+from App.database import db, read_replica
+from App.models import Staff, StaffSnapshot, Student, Review
+
+logger = logging.getLogger(__name__)
+
+# Process-Local Cache Of Staff Snapshots, Keyed By Staff ID (Sized By STAFF_CACHE_SIZE/STAFF_CACHE_TTL)
+staff_cache = TTLCache('staff')
 
 # Create A Staff (Regular & Admin)
 def create_staff(prefix, firstname, lastname, email, is_admin, password, created_by_id):
@@ -37,14 +46,63 @@ def create_staff(prefix, firstname, lastname, email, is_admin, password, created
             db.session.commit()
             return newstaff
     except Exception as e:
-        print(f"Error While Creating Staff: {e}")
+        logger.exception("Error While Creating Staff: %s", e)
         db.session.rollback()
         return None
 
-# Get Staff
+# Get Staff - Creator Joined In So get_json() Does Not Lazy Load
+@read_replica
 def get_staff(id):
-    return Staff.query.filter_by(id=id).first()
+    return Staff.query.options(joinedload(Staff.created_by)).filter_by(id=id).first()
 
 # Get Staff Via Email - Unique Identification
 def get_staff_by_email(email):
-    return Staff.query.filter_by(email=email).first()
\ No newline at end of file
+    return Staff.query.filter_by(email=email).first()
+
+# Get Staff (Cached Snapshot) - Used By The JWT Callbacks On Every Authenticated Request
+def get_cached_staff(id):
+    try:
+        id = int(id)
+    except (TypeError, ValueError):
+        return None
+    return staff_cache.get_or_load(id, _load_staff_snapshot)
+
+def _load_staff_snapshot(id):
+    row = db.session.execute(select(*[getattr(Staff, field) for field in StaffSnapshot._fields]).where(Staff.id == id)).first()
+    return StaffSnapshot(*row) if row else None
+
+def get_staff_cache_stats():
+    return staff_cache.stats()
+
+# Any Staff Write (create_staff, Updates, Deletes) Invalidates That Staff's Cached Snapshot -
+# Once When Flushed & Again After Commit, So A Read Racing The Commit Cannot Re-Cache Stale Data
+@event.listens_for(Staff, 'after_insert')
+@event.listens_for(Staff, 'after_update')
+@event.listens_for(Staff, 'after_delete')
+def _invalidate_staff_on_write(mapper, connection, staff):
+    staff_cache.invalidate(staff.id)
+    session = Session.object_session(staff)
+    if session is not None:
+        session.info.setdefault('written_staff_ids', set()).add(staff.id)
+
+@event.listens_for(Session, 'after_commit')
+def _invalidate_staff_on_commit(session):
+    for id in session.info.pop('written_staff_ids', ()):
+        staff_cache.invalidate(id)
+
+@event.listens_for(Session, 'after_soft_rollback')
+def _discard_written_staff(session, previous_transaction):
+    session.info.pop('written_staff_ids', None)
+
+# Reviews Are Listed With Their Reviewer's Name, So Renaming A Staff Bumps The Version (ETag) Of Every Student
+# They Have Reviewed - In The Same Flush, So A Conditional GET Never Answers 304 With The Old Name
+REVIEWER_NAME_FIELDS = ('prefix', 'firstname', 'lastname')
+
+@event.listens_for(Staff, 'after_update')
+def _bump_reviewed_student_versions(mapper, connection, staff):
+    state = inspect(staff)
+    if any(state.attrs[field].history.has_changes() for field in REVIEWER_NAME_FIELDS):
+        student = Student.__table__.c
+        reviewed = select(Review.__table__.c.student_id).where(Review.__table__.c.reviewer_id == staff.id)
+        connection.execute(update(Student.__table__).where(student.student_id.in_(reviewed))
+                           .values(version=student.version + 1))
@@ -1,30 +1,134 @@
-from App.database import db
-from App.models import Student, Review
+import logging
+from flask import current_app
+from sqlalchemy import select
+from sqlalchemy.orm import joinedload
+from App.database import db, read_replica
+from App.models import Student, Review, Staff, RatingSummary
+from .review import rating_summary_columns
+
+logger = logging.getLogger(__name__)
 
 # Get Student
+@read_replica
 def get_student(student_id):
     return Student.query.get(student_id)
 
-# Get Student (JSON)
-def get_student_json(student_id):
-    student = Student.query.get(student_id)
+# Get Student Version - The Only Lookup Needed To Answer A Conditional GET (None If Not Found)
+def get_student_version(student_id):
+    return db.session.scalar(select(Student.version).where(Student.student_id == student_id))
+
+# Get Student (JSON) - Column-Only Queries, Two In Total However Many Reviews
+# With summary=True The Student's Rating Summary Is Joined Into The First Query
+@read_replica
+def get_student_json(student_id, summary=False):
+    query = select(Student.student_id, Student.firstname, Student.lastname, Student.email)
+    if summary:
+        query = query.add_columns(*rating_summary_columns()) \
+                     .outerjoin(RatingSummary, RatingSummary.student_id == Student.student_id)
+    student = db.session.execute(query.where(Student.student_id == student_id)).first()
     if not student:
         return []
-    return student.get_json()
+    texts = db.session.scalars(
+        select(Review.text).where(Review.student_id == student_id).order_by(Review.id)
+    ).all()
+    student_json = {
+        'student_id': student.student_id,
+        'firstname': student.firstname,
+        'lastname': student.lastname,
+        'email': student.email,
+        'reviews': texts,
+    }
+    if summary:
+        student_json['summary'] = RatingSummary.row_json(student)
+    return student_json
+
+# Get Many Students (JSON) - Two Set-Based Queries However Many IDs, Returns (Students By ID, Missing IDs)
+def get_students_json(student_ids):
+    student_ids = list(dict.fromkeys(student_ids))
+    if not student_ids:
+        return {}, []
+    rows = db.session.execute(
+        select(Student.student_id, Student.firstname, Student.lastname, Student.email)
+        .where(Student.student_id.in_(student_ids))
+    )
+    students = {row.student_id: {
+        'student_id': row.student_id,
+        'firstname': row.firstname,
+        'lastname': row.lastname,
+        'email': row.email,
+        'reviews': [],
+    } for row in rows}
+    if students:
+        reviews = db.session.execute(
+            select(Review.student_id, Review.text)
+            .where(Review.student_id.in_(list(students)))
+            .order_by(Review.student_id, Review.id)
+        )
+        for review in reviews:
+            students[review.student_id]['reviews'].append(review.text)
+    missing = [student_id for student_id in student_ids if student_id not in students]
+    return {student_id: students[student_id] for student_id in student_ids if student_id in students}, missing
 
-# Get Student Reviews
+# Get Student Reviews - Reviewers Joined In So __repr__ Does Not Lazy Load
 def get_student_reviews(student_id):
-    reviews = Review.query.filter_by(student_id=student_id).all()
+    reviews = Review.query.options(joinedload(Review.reviewer)).filter_by(student_id=student_id).order_by(Review.id).all()
     if not reviews:
         return None
     return reviews
 
-# Get Student Reviews (JSON)
+# Review Rows Joined With Their Reviewer's Name (For Review.row_json)
+def select_review_rows():
+    return (select(Review.id, Review.student_id, Review.text, Review.rating,
+                   Staff.prefix, Staff.firstname, Staff.lastname)
+            .join(Staff, Review.reviewer_id == Staff.id))
+
+# Get Student Reviews (JSON) - One Column-Only Query
+@read_replica
 def get_student_reviews_json(student_id):
-    reviews = Review.query.filter_by(student_id=student_id).all()
-    if not reviews:
-        return []
-    return [review.get_json() for review in reviews]
+    rows = db.session.execute(
+        select_review_rows().where(Review.student_id == student_id).order_by(Review.id)
+    )
+    return [Review.row_json(row) for row in rows]
+
+# Review Page Size - Defaults To REVIEWS_PAGE_SIZE & Is Capped At REVIEWS_MAX_PAGE_SIZE
+def get_reviews_page_size(limit=None):
+    max_size = current_app.config.get('REVIEWS_MAX_PAGE_SIZE', 200)
+    if limit is None:
+        limit = current_app.config.get('REVIEWS_PAGE_SIZE', 50)
+    return max(1, min(int(limit), max_size))
+
+# Get A Page Of Student Reviews (JSON) - Keyset Paginated On Review.id
+def get_student_reviews_page_json(student_id, limit=None, after=None):
+    limit = get_reviews_page_size(limit)
+    query = select_review_rows().where(Review.student_id == student_id)
+    if after is not None:
+        query = query.where(Review.id > after)
+    # One Extra Row Tells Us Whether There Is A Next Page
+    rows = db.session.execute(query.order_by(Review.id).limit(limit + 1)).all()
+    next_cursor = rows[limit - 1].id if len(rows) > limit else None
+    return {
+        'reviews': [Review.row_json(row) for row in rows[:limit]],
+        'next': next_cursor,
+    }
+
+# Iterate Over Every Page Of Student Reviews (JSON) - One Page In Memory At A Time
+def iter_student_reviews_pages_json(student_id, limit=None, after=None):
+    while True:
+        page = get_student_reviews_page_json(student_id, limit, after)
+        yield page
+        after = page['next']
+        if after is None:
+            return
+
+# Stream Every Review Of A Student (JSON) Row By Row - Server-Side Cursor, Column-Only Rows
+def iter_student_reviews_json(student_id, yield_per=None):
+    yield_per = yield_per or current_app.config.get('STREAM_YIELD_PER', 1000)
+    rows = db.session.execute(
+        select_review_rows().where(Review.student_id == student_id).order_by(Review.id)
+        .execution_options(yield_per=yield_per)
+    )
+    for row in rows:
+        yield Review.row_json(row)
 
 # Add A Student
 def add_student (student_id, firstname, lastname, email):
@@ -39,7 +143,7 @@ def add_student (student_id, firstname, lastname, email):
         return new_student
 
     except Exception as e:
-        print(f"Error While Adding Student: {e}")
+        logger.exception("Error While Adding Student: %s", e)
         db.session.rollback()
         return None
 
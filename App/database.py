@@ -1,13 +1,165 @@
+import random, sys
+from contextvars import ContextVar
+from functools import wraps
+from flask import has_request_context, request
 from flask_sqlalchemy import SQLAlchemy
-from flask_migrate import Migrate
+from flask_sqlalchemy.session import Session
+from sqlalchemy import Select, TextClause, event
+from sqlalchemy.engine import make_url
+from App.config import REPLICA_BIND_PREFIX
+from App.sqlite_tuning import tune_sqlite_engine
 
-db = SQLAlchemy()
+READ_ONLY_METHODS = ('GET', 'HEAD', 'OPTIONS')
+PRIMARY_PINNED = 'app.db_primary_pinned'
+READ_REPLICA = 'app.db_read_replica'
 
+# True Inside A read_replica Controller Called Outside A Request (CLI Commands, Scripts)
+_replica_reads = ContextVar('replica_reads', default=False)
+
+class RoutingSession(Session):
+    """Session that sends reads to a random read replica (the ``replica_*`` binds) during
+    read-only requests (GET/HEAD/OPTIONS) and, outside requests, while a ``read_replica``
+    controller is running. Requests that write (POST, PUT, ...) never read from a replica,
+    so their checks see the primary's data.
+
+    Writes, flushes and everything after the first write of a request (or, outside a
+    request, of the session) stay on the primary so callers always read their own writes.
+
+    The replica is picked once per request (or session) and reused for all its reads, so
+    they never go back in time between replicas that lag by different amounts.
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and self._reads_from_replica(clause):
+            replica = self._read_replica()
+            if replica is not None:
+                return replica
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+    def _read_replica(self):
+        scope = request.environ if has_request_context() else self.info
+        engines = self._db.engines
+        key = scope.get(READ_REPLICA)
+        if key is None or key not in engines:
+            keys = [key for key in engines if key and key.startswith(REPLICA_BIND_PREFIX)]
+            if not keys:
+                return None
+            key = scope[READ_REPLICA] = random.choice(keys)
+        return engines[key]
+
+    def _reads_from_replica(self, clause):
+        if self._flushing or not is_read_statement(clause) or primary_pinned(self):
+            return False
+        if has_request_context():
+            return request.method in READ_ONLY_METHODS
+        return _replica_reads.get()
+
+    def close(self):
+        self.info.pop(PRIMARY_PINNED, None)
+        self.info.pop(READ_REPLICA, None)
+        super().close()
+
+db = SQLAlchemy(session_options={'class_': RoutingSession})
+
+def is_read_statement(clause):
+    if isinstance(clause, Select):
+        return True
+    return isinstance(clause, TextClause) and clause.text.lstrip()[:6].upper() in ('SELECT', 'WITH')
+
+# Read-Your-Writes: Pinned For The Rest Of The Request (WSGI environ - g Is Shared In Tests), Else The Session
+def primary_pinned(session):
+    if has_request_context():
+        return request.environ.get(PRIMARY_PINNED, False)
+    return session.info.get(PRIMARY_PINNED, False)
+
+def pin_primary(session):
+    if has_request_context():
+        request.environ[PRIMARY_PINNED] = True
+    else:
+        session.info[PRIMARY_PINNED] = True
+
+@event.listens_for(RoutingSession, 'after_flush')
+def _pin_after_flush(session, flush_context):
+    pin_primary(session)
+
+@event.listens_for(RoutingSession, 'do_orm_execute')
+def _pin_after_write(orm_execute_state):
+    if not is_read_statement(orm_execute_state.statement):
+        pin_primary(orm_execute_state.session)
+
+# Controllers Wrapped With This Read From A Replica Outside Requests (Unless The Caller Has Already Written)
+def read_replica(fn):
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        token = _replica_reads.set(True)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            _replica_reads.reset(token)
+    return wrapper
+
+# Flask-Migrate (& Alembic) Are Only Needed By The `flask db` Commands
 def get_migrate(app):
+    from flask_migrate import Migrate
     return Migrate(app, db)
 
 def create_db():
     db.create_all()
 
+def gevent_active():
+    # Only Once The (gunicorn gevent) Worker Has Imported gevent & Monkey Patched Sockets
+    if 'gevent' not in sys.modules:
+        return False
+    from gevent import monkey
+    return monkey.is_module_patched('socket')
+
+# psycopg2 Talks To Postgres In C, Out Of Reach Of gevent's Monkey Patching - Without This Every Query Blocks
+# The Whole Worker. The Wait Callback (As In psycogreen) Makes libpq Async & Yields To The Hub While It Waits
+def gevent_wait_callback(connection, timeout=None):
+    from gevent.socket import wait_read, wait_write
+    from psycopg2 import OperationalError, extensions
+    while True:
+        state = connection.poll()
+        if state == extensions.POLL_OK:
+            break
+        elif state == extensions.POLL_READ:
+            wait_read(connection.fileno(), timeout=timeout)
+        elif state == extensions.POLL_WRITE:
+            wait_write(connection.fileno(), timeout=timeout)
+        else:
+            raise OperationalError(f"Bad Result From poll: {state!r}")
+
+# Install The Wait Callback If gevent Is Active & psycopg2 Is Available - Returns True If It Is Installed
+def patch_psycopg2_for_gevent():
+    if not gevent_active():
+        return False
+    try:
+        from psycopg2 import extensions
+    except ImportError:
+        return False
+    extensions.set_wait_callback(gevent_wait_callback)
+    return True
+
+def log_engine_settings(app):
+    url = make_url(app.config['SQLALCHEMY_DATABASE_URI'])
+    options = app.config.get('SQLALCHEMY_ENGINE_OPTIONS') or {}
+    settings = ', '.join(f'{key}={value}' for key, value in sorted(options.items())) or 'defaults'
+    replicas = len(app.config.get('SQLALCHEMY_REPLICA_URIS') or [])
+    app.logger.info("Database: %s | Pool: %s | Read Replicas: %d | gevent Wait Callback: %s",
+                    url.render_as_string(hide_password=True), settings, replicas, app.extensions.get('psycopg2_gevent', False))
+
+# SQLite Engines (Primary & Replicas) Get The SQLITE_PRAGMAS On Connect & A Per-Process Write Lock
+def tune_sqlite_engines(app):
+    serializers = app.extensions.setdefault('sqlite_write_serializers', {})
+    with app.app_context():
+        for key, engine in db.engines.items():
+            if engine.dialect.name == 'sqlite':
+                serializers[key] = tune_sqlite_engine(engine, app.config.get('SQLITE_PRAGMAS'),
+                                                      app.config.get('SQLITE_SERIALIZE_WRITES', True))
+
 def init_db(app):
-    db.init_app(app)
\ No newline at end of file
+    if app.config.get('DB_GEVENT_WAIT_CALLBACK', True):
+        app.extensions['psycopg2_gevent'] = patch_psycopg2_for_gevent()
+    db.init_app(app)
+    tune_sqlite_engines(app)
+    log_engine_settings(app)
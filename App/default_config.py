@@ -1,2 +1,42 @@
 SQLALCHEMY_DATABASE_URI="sqlite:///temp-database.db"
-SECRET_KEY="secret key"
\ No newline at end of file
+SECRET_KEY="secret key"
+IMPORT_BATCH_SIZE=1000
+REVIEWS_PAGE_SIZE=50
+REVIEWS_MAX_PAGE_SIZE=200
+STAFF_CACHE_SIZE=256
+STAFF_CACHE_TTL=300
+PASSWORD_HASH_METHOD="pbkdf2:sha256:260000"
+PASSWORD_SALT_LENGTH=16
+PASSWORD_HASH_OFFLOAD=True
+PASSWORD_HASH_THREADS=4
+REVIEW_BATCH_MAX_ITEMS=1000
+STUDENT_BATCH_MAX_ITEMS=10000
+STUDENTS_LOOKUP_MAX_IDS=500
+SEARCH_PAGE_SIZE=20
+SEARCH_MAX_PAGE_SIZE=100
+HTTP_CACHE_CONTROL="private, no-cache"
+STREAM_YIELD_PER=1000
+DB_POOL_SIZE=5
+DB_MAX_OVERFLOW=10
+DB_POOL_RECYCLE=1800
+DB_POOL_TIMEOUT=30
+DB_POOL_PRE_PING=True
+DB_GEVENT_WAIT_CALLBACK=True
+SQLALCHEMY_REPLICA_URIS=[]
+SQLITE_PRAGMAS={"journal_mode": "WAL", "synchronous": "NORMAL", "mmap_size": 268435456, "cache_size": -64000, "busy_timeout": 5000, "temp_store": "MEMORY"}
+SQLITE_SERIALIZE_WRITES=True
+METRICS_ENABLED=True
+METRICS_DIR=None
+METRICS_FLUSH_INTERVAL=1.0
+QUERY_DIAGNOSTICS=False
+SLOW_QUERY_THRESHOLD_MS=100
+N_PLUS_ONE_THRESHOLD=5
+N_PLUS_ONE_STRICT=False
+LOG_JSON=True
+LOG_LEVEL="INFO"
+LOG_SAMPLE_RATES={"App.access": 1.0, "App.controllers.auth": 0.1}
+LEADERBOARD_REFRESH_INTERVAL=60
+LEADERBOARD_REBUILD_INTERVAL=3600
+LEADERBOARD_STALE_AFTER=180
+LEADERBOARD_SIZE=100
+LEADERBOARD_MIN_REVIEWS=3
\ No newline at end of file
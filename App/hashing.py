@@ -0,0 +1,52 @@
+import sys
+from flask import current_app, has_app_context
+from werkzeug.security import DEFAULT_PBKDF2_ITERATIONS, check_password_hash, generate_password_hash
+
+DEFAULT_HASH_METHOD = f'pbkdf2:sha256:{DEFAULT_PBKDF2_ITERATIONS}'
+DEFAULT_SALT_LENGTH = 16
+
+def _config(key, default):
+    return current_app.config.get(key, default) if has_app_context() else default
+
+def get_hash_method():
+    method = _config('PASSWORD_HASH_METHOD', DEFAULT_HASH_METHOD)
+    # Werkzeug Stores The Iteration Count Even When The Method Leaves It Out
+    if method.startswith('pbkdf2:') and method.count(':') == 1:
+        method = f'{method}:{DEFAULT_PBKDF2_ITERATIONS}'
+    return method
+
+def get_salt_length():
+    return int(_config('PASSWORD_SALT_LENGTH', DEFAULT_SALT_LENGTH))
+
+def _gevent_hub():
+    # gevent Is Only Relevant Once The Worker Has Imported & Monkey Patched It
+    if 'gevent' not in sys.modules:
+        return None
+    from gevent import get_hub, monkey
+    if not monkey.is_module_patched('socket'):
+        return None
+    return get_hub()
+
+# Run A CPU Bound Call In gevent's Native Thread Pool So Other Greenlets Keep Being Served
+# (hashlib's PBKDF2 Releases The GIL) - Without gevent It Simply Runs Inline
+def run_blocking(fn, *args):
+    hub = _gevent_hub() if _config('PASSWORD_HASH_OFFLOAD', True) else None
+    if hub is None:
+        return fn(*args)
+    threads = _config('PASSWORD_HASH_THREADS', None)
+    if threads and hub.threadpool.maxsize != int(threads):
+        hub.threadpool.maxsize = int(threads)
+    return hub.threadpool.apply(fn, args)
+
+def hash_password(password):
+    return run_blocking(generate_password_hash, password, get_hash_method(), get_salt_length())
+
+def verify_password(password_hash, password):
+    return run_blocking(check_password_hash, password_hash, password)
+
+# True When A Stored Hash Was Made With A Different Method, Cost Or Salt Length Than Configured
+def password_needs_rehash(password_hash):
+    if not password_hash or password_hash.count('$') != 2:
+        return True
+    method, salt, _ = password_hash.split('$')
+    return method != get_hash_method() or len(salt) != get_salt_length()
@@ -0,0 +1,65 @@
+from flask import current_app, stream_with_context
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError: # Optional - Falls Back To The Standard Library json
+    orjson = None
+
+NDJSON_MIMETYPE = 'application/x-ndjson'
+
+class FastJSONProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson, or Flask's default provider when orjson is not installed."""
+
+    def _options(self, indent=False):
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        sort_keys = self._app.config.get('JSON_SORT_KEYS')
+        if self.sort_keys if sort_keys is None else sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return option
+
+    # Compact UTF-8 Bytes - One NDJSON Line
+    def dumps_bytes(self, obj, **kwargs):
+        if orjson is None or kwargs:
+            kwargs.setdefault('separators', (',', ':'))
+            return self.dumps(obj, **kwargs).encode()
+        return orjson.dumps(obj, default=self.default, option=self._options())
+
+    def dumps(self, obj, **kwargs):
+        if orjson is None or kwargs:
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=self.default, option=self._options()).decode()
+
+    def loads(self, s, **kwargs):
+        if orjson is None or kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        if orjson is None:
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        # Same Rule As Flask - Indented In Debug Mode Unless `compact` Says Otherwise
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        body = orjson.dumps(obj, default=self.default, option=self._options(indent=indent))
+        return self._app.response_class(body + b'\n', mimetype=self.mimetype)
+
+def init_json(app):
+    app.json = FastJSONProvider(app)
+
+# Encode Rows As NDJSON Lines (Compact UTF-8 Bytes, Newline Terminated) With The App's JSON Provider
+def iter_ndjson(rows):
+    json = current_app.json
+    dumps = json.dumps_bytes if isinstance(json, FastJSONProvider) else lambda row: json.dumps(row, separators=(',', ':')).encode()
+    for row in rows:
+        yield dumps(row) + b'\n'
+
+# Stream An Iterable Of JSON-Serializable Rows As NDJSON, One Line Per Row As It Is Produced
+def ndjson_response(rows, status=200):
+    return streamed_response(iter_ndjson(rows), NDJSON_MIMETYPE, status)
+
+# Stream Already Encoded Chunks, Keeping The Request Context Alive Until The Last One Is Sent
+def streamed_response(chunks, mimetype, status=200, headers=None):
+    return current_app.response_class(stream_with_context(chunks), status=status, mimetype=mimetype, headers=headers)
@@ -0,0 +1,178 @@
+import atexit, json, logging, os, queue, random, sys, time, traceback, uuid
+from logging.handlers import QueueHandler, QueueListener
+from flask import has_request_context, request
+
+# Structured, Non-Blocking Logging For Everything Under The 'App' Logger
+# Records Are Enriched With The Request's Context & Queued On The Request Path; A QueueListener
+# Thread Formats Them As JSON Lines & Does The (Blocking) Write To stderr
+
+REQUEST_ID = 'app.request_id'
+REQUEST_STARTED = 'app.request_started'
+REQUEST_ID_HEADER = 'X-Request-ID'
+
+# Standard LogRecord Attributes - Anything Else On A Record Came From `extra=` & Is Logged As A Field
+RECORD_ATTRIBUTES = set(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime'}
+
+logger = logging.getLogger('App')
+access_logger = logging.getLogger('App.access')
+
+# Staff ID Only If This Request Has Already Resolved It (Logging Never Decodes Tokens Or Queries)
+def _staff_id():
+    auth = request.environ.get('app.request_auth')
+    jwt_data = getattr(auth, 'known_jwt_data', None)
+    return jwt_data.get('sub') if jwt_data else None
+
+class RequestContextFilter(logging.Filter):
+    """Copies the request ID, endpoint, staff ID & time elapsed so far onto each record (on the request path)."""
+
+    def filter(self, record):
+        if has_request_context():
+            record.request_id = request.environ.get(REQUEST_ID)
+            record.endpoint = request.endpoint
+            record.method = request.method
+            record.path = request.path
+            record.staff_id = _staff_id()
+            started = request.environ.get(REQUEST_STARTED)
+            if started is not None and getattr(record, 'duration_ms', None) is None:
+                record.duration_ms = round((time.perf_counter() - started) * 1000, 3)
+        return True
+
+class SamplingFilter(logging.Filter):
+    """Keeps `rate` of the records below WARNING from each configured logger (warnings & errors are never dropped).
+
+    A record can also carry its own rate with ``extra={'sample_rate': 0.01}``. Kept records
+    are logged with their sample_rate, so totals can be scaled back up.
+    """
+
+    def __init__(self, rates=None):
+        super().__init__()
+        self.rates = dict(rates or {})
+
+    def rate_for(self, record):
+        rate = getattr(record, 'sample_rate', None)
+        if rate is not None:
+            return rate
+        name = record.name
+        while name:
+            if name in self.rates:
+                return self.rates[name]
+            name = name.rpartition('.')[0]
+        return 1.0
+
+    def filter(self, record):
+        if record.levelno >= logging.WARNING:
+            return True
+        rate = self.rate_for(record)
+        if rate >= 1.0:
+            return True
+        record.sample_rate = rate
+        return random.random() < rate
+
+class ContextQueueHandler(QueueHandler):
+    # Only Resolves The Message & Traceback Text Here - JSON Formatting Happens In The Listener
+    def prepare(self, record):
+        record = logging.makeLogRecord(vars(record))
+        record.message = record.getMessage()
+        if record.exc_info:
+            record.exc_text = ''.join(traceback.format_exception(*record.exc_info)).rstrip()
+        record.msg, record.args, record.exc_info = record.message, None, None
+        return record
+
+class JSONFormatter(logging.Formatter):
+    converter = time.gmtime
+
+    def format(self, record):
+        entry = {
+            'time': self.formatTime(record, '%Y-%m-%dT%H:%M:%S') + f'.{int(record.msecs):03d}Z',
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in RECORD_ATTRIBUTES and value is not None:
+                entry[key] = value
+        if record.exc_text:
+            entry['exception'] = record.exc_text
+        elif record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+class StderrHandler(logging.StreamHandler):
+    # Whatever sys.stderr Is At Write Time (Test Runners Swap It Out)
+    @property
+    def stream(self):
+        return sys.stderr
+
+    @stream.setter
+    def stream(self, value):
+        pass
+
+class LogPipeline:
+    """The queue, its listener thread & the handler attached to the 'App' logger (one per process)."""
+
+    def __init__(self):
+        self.handler = None
+        self.listener = None
+        self._config = None
+
+    def start(self, level, sample_rates):
+        self.stop()
+        records = queue.SimpleQueue()
+        output = StderrHandler()
+        output.setFormatter(JSONFormatter())
+        self.handler = ContextQueueHandler(records)
+        self.handler.addFilter(RequestContextFilter())
+        self.handler.addFilter(SamplingFilter(sample_rates))
+        self.listener = QueueListener(records, output, respect_handler_level=True)
+        self.listener.start()
+        logger.addHandler(self.handler)
+        logger.setLevel(level)
+        self._config = (level, sample_rates)
+
+    def stop(self):
+        if self.handler is not None:
+            logger.removeHandler(self.handler)
+            self.handler = None
+        if self.listener is not None:
+            self.listener.stop()  # Drains Whatever Is Still Queued
+            self.listener = None
+
+    # Block Until Everything Queued So Far Has Been Written
+    def flush(self):
+        if self.listener is not None:
+            self.listener.stop()
+            self.listener.start()
+
+    # The Listener Thread Does Not Survive fork() (e.g. gunicorn --preload) - Each Child Starts Its Own
+    def restart_after_fork(self):
+        if self.handler is not None:
+            logger.removeHandler(self.handler)
+            self.handler, self.listener = None, None
+            self.start(*self._config)
+
+pipeline = LogPipeline()
+atexit.register(pipeline.stop)
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=pipeline.restart_after_fork)
+
+def init_logging(app):
+    if not app.config.get('LOG_JSON', True):
+        return
+    pipeline.start(app.config.get('LOG_LEVEL', 'INFO'), app.config.get('LOG_SAMPLE_RATES') or {})
+
+    @app.before_request
+    def _start_request_log():
+        request.environ[REQUEST_STARTED] = time.perf_counter()
+        request.environ[REQUEST_ID] = request.headers.get(REQUEST_ID_HEADER) or uuid.uuid4().hex
+
+    @app.after_request
+    def _access_log(response):
+        started = request.environ.get(REQUEST_STARTED)
+        if started is None:
+            return response
+        response.headers[REQUEST_ID_HEADER] = request.environ[REQUEST_ID]
+        level = logging.ERROR if response.status_code >= 500 else logging.INFO
+        access_logger.log(level, '%s %s %s', request.method, request.path, response.status_code,
+                          extra={'status': response.status_code, 'size': response.content_length,
+                                 'duration_ms': round((time.perf_counter() - started) * 1000, 3)})
+        return response
@@ -1,12 +1,14 @@
-import os, csv
 from flask import Flask, jsonify
-from flask_uploads import DOCUMENTS, IMAGES, TEXT, UploadSet, configure_uploads
 from flask_cors import CORS
-from werkzeug.utils import secure_filename
-from werkzeug.datastructures import  FileStorage
 
-from App.database import init_db
+from App.cache import reset_caches
+from App.database import db, init_db, patch_psycopg2_for_gevent
 from App.config import load_config
+from App.json_provider import init_json
+from App.log import init_logging
+from App.metrics import init_metrics
+from App.query_diagnostics import init_query_diagnostics
+from App.refresher import init_leaderboard_refresher
 
 from App.controllers import (
     setup_jwt,
@@ -15,19 +17,43 @@ from App.controllers import (
 
 from App.views import views
 
+# What Each create_app() Profile Adds On Top Of The HTTP API - "api" Is What gunicorn Serves,
+# "full" Is For The CLI, Tests & Local Development (Templates, Uploads & A Global App Context)
+PROFILES = {
+    'full': {'template_context', 'uploads', 'app_context'},
+    'api': set(),
+}
+
 def add_views(app):
     for view in views:
         app.register_blueprint(view)
 
-def create_app(overrides={}):
+# Flask-Reuploaded Is Only Imported By Profiles That Configure Upload Sets
+def init_uploads(app):
+    from flask_uploads import DOCUMENTS, IMAGES, TEXT, UploadSet, configure_uploads
+    photos = UploadSet('photos', TEXT + DOCUMENTS + IMAGES)
+    configure_uploads(app, photos)
+    return photos
+
+def create_app(overrides={}, profile='full'):
+    if profile not in PROFILES:
+        raise ValueError(f"Unknown App Profile {profile!r}, Expected One Of: {', '.join(PROFILES)}")
+    features = PROFILES[profile]
     app = Flask(__name__, static_url_path='/static')
     load_config(app, overrides)
+    app.config['APP_PROFILE'] = profile
+    init_logging(app)
+    init_json(app)
     CORS(app)
-    add_auth_context(app)
-    photos = UploadSet('photos', TEXT + DOCUMENTS + IMAGES)
-    configure_uploads(app, photos)
+    if 'template_context' in features:
+        add_auth_context(app)
+    if 'uploads' in features:
+        init_uploads(app)
     add_views(app)
     init_db(app)
+    init_metrics(app)
+    init_query_diagnostics(app)
+    init_leaderboard_refresher(app)
     jwt = setup_jwt(app)
     @jwt.invalid_token_loader
     def custom_invalid_token_response(error):
@@ -35,5 +61,23 @@ def create_app(overrides={}):
     @jwt.unauthorized_loader
     def custom_unauthorized_response(error):
         return jsonify(error="Not Authorized"), 401
-    app.app_context().push()
-    return app
\ No newline at end of file
+    if 'app_context' in features:
+        app.app_context().push()
+    return app
+
+# A Worker Forked From A Master That Preloaded The App (gunicorn preload_app) Must Not Reuse The Master's
+# Pooled Connections - Drop Them Without Closing (close=False Leaves The Master's Sockets Alone) & Start
+# With Empty Caches
+def reset_after_fork(app):
+    with app.app_context():
+        for engine in db.engines.values():
+            engine.dispose(close=False)
+    reset_caches()
+
+# Once The Worker Has Monkey Patched (gevent) - The Preloading Master Never Does, So The psycopg2 Wait
+# Callback & gevent-Aware SQLite Write Locks Are Set Up Here
+def init_worker(app):
+    if app.config.get('DB_GEVENT_WAIT_CALLBACK', True):
+        app.extensions['psycopg2_gevent'] = patch_psycopg2_for_gevent()
+    for serializer in app.extensions.get('sqlite_write_serializers', {}).values():
+        serializer.reset()
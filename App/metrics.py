@@ -0,0 +1,287 @@
+import glob, json, os, threading, time
+from flask import has_request_context, request
+from sqlalchemy import event
+from App.database import db
+
+# Per-Request Instrumentation Exposed In Prometheus Text Format On /metrics
+# Each Process Keeps Its Own Registry; With METRICS_DIR Set Every Process (e.g. gunicorn Worker) Also Writes
+# A metrics-<pid>.json Snapshot There & /metrics Sums The Snapshots Of All Of Them. When A Worker Exits, The
+# gunicorn Master Folds Its Snapshot Into metrics-exited.json, So Its Counts Survive & Files Don't Pile Up
+
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+STATEMENT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+WAIT_BUCKETS = (0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+# Name -> (Type, Help, Buckets)
+METRICS = {
+    'app_http_requests_total': ('counter', 'HTTP requests by endpoint, method and status.', None),
+    'app_http_request_duration_seconds': ('histogram', 'Time spent handling a request.', DURATION_BUCKETS),
+    'app_http_response_size_bytes': ('histogram', 'Response body size (streamed responses are not counted).', SIZE_BUCKETS),
+    'app_db_statements_per_request': ('histogram', 'SQL statements executed per request.', STATEMENT_BUCKETS),
+    'app_db_statements_total': ('counter', 'SQL statements executed.', None),
+    'app_db_time_seconds_total': ('counter', 'Time spent executing SQL statements.', None),
+    'app_db_pool_checkout_wait_seconds': ('histogram', 'Time spent waiting for a pooled database connection.', WAIT_BUCKETS),
+}
+
+REQUEST_METRICS = 'app.request_metrics'
+EXITED_SNAPSHOT = 'metrics-exited.json'
+FOLDED_HISTORY = 100
+UNMATCHED = 'unmatched'
+
+class Registry:
+    """Thread-safe counters & histograms, keyed by metric name plus a sorted tuple of label pairs."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counters = {}
+        self.histograms = {}
+
+    def inc(self, name, labels, value=1.0):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0.0) + value
+
+    def observe(self, name, labels, value):
+        key = (name, tuple(sorted(labels.items())))
+        buckets = METRICS[name][2]
+        with self._lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = {'buckets': [0] * len(buckets), 'sum': 0.0, 'count': 0}
+            for index, bound in enumerate(buckets):
+                if value <= bound:
+                    histogram['buckets'][index] += 1
+            histogram['sum'] += value
+            histogram['count'] += 1
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                'counters': [[name, dict(labels), value] for (name, labels), value in self.counters.items()],
+                'histograms': [[name, dict(labels), dict(histogram, buckets=list(histogram['buckets']))]
+                               for (name, labels), histogram in self.histograms.items()],
+            }
+
+    def clear(self):
+        with self._lock:
+            self.counters.clear()
+            self.histograms.clear()
+
+registry = Registry()
+
+# Sum Snapshots (From Several Processes) Into {(name, labels): value} & {(name, labels): histogram}
+def merge_snapshots(snapshots):
+    counters, histograms = {}, {}
+    for snapshot in snapshots:
+        for name, labels, value in snapshot.get('counters', []):
+            key = (name, tuple(sorted(labels.items())))
+            counters[key] = counters.get(key, 0.0) + value
+        for name, labels, histogram in snapshot.get('histograms', []):
+            key = (name, tuple(sorted(labels.items())))
+            merged = histograms.setdefault(key, {'buckets': [0] * len(histogram['buckets']), 'sum': 0.0, 'count': 0})
+            merged['buckets'] = [a + b for a, b in zip(merged['buckets'], histogram['buckets'])]
+            merged['sum'] += histogram['sum']
+            merged['count'] += histogram['count']
+    return counters, histograms
+
+# The Inverse Of merge_snapshots - Merged Counters & Histograms Back Into One Snapshot
+def to_snapshot(counters, histograms):
+    return {
+        'counters': [[name, dict(labels), value] for (name, labels), value in counters.items()],
+        'histograms': [[name, dict(labels), histogram] for (name, labels), histogram in histograms.items()],
+    }
+
+def _labels(labels, **extra):
+    pairs = list(labels) + list(extra.items())
+    if not pairs:
+        return ''
+    escape = lambda value: str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+    return '{' + ','.join(f'{key}="{escape(value)}"' for key, value in pairs) + '}'
+
+def _number(value):
+    return repr(float(value)) if isinstance(value, float) and not value.is_integer() else str(int(value))
+
+# Prometheus Text Exposition Format (Version 0.0.4)
+def render(snapshots):
+    counters, histograms = merge_snapshots(snapshots)
+    lines = []
+    for name, (kind, help, buckets) in METRICS.items():
+        lines += [f'# HELP {name} {help}', f'# TYPE {name} {kind}']
+        if kind == 'counter':
+            for (metric, labels), value in sorted(counters.items()):
+                if metric == name:
+                    lines.append(f'{name}{_labels(labels)} {_number(value)}')
+            continue
+        for (metric, labels), histogram in sorted(histograms.items()):
+            if metric != name:
+                continue
+            for bound, count in zip(buckets, histogram['buckets']):
+                lines.append(f'{name}_bucket{_labels(labels, le=bound)} {count}')
+            lines.append(f'{name}_bucket{_labels(labels, le="+Inf")} {histogram["count"]}')
+            lines.append(f'{name}_sum{_labels(labels)} {_number(histogram["sum"])}')
+            lines.append(f'{name}_count{_labels(labels)} {histogram["count"]}')
+    return '\n'.join(lines) + '\n'
+
+class SnapshotWriter:
+    """Writes this process's registry to METRICS_DIR/metrics-<pid>.json at most every `interval` seconds.
+
+    Each snapshot carries a `worker` id (pid plus start time, so a reused pid is a new worker). The
+    gunicorn master folds an exited worker into metrics-exited.json before removing its file, and lists
+    its id there; read_all() reads the worker files first and skips any already folded, so a worker is
+    never counted twice (or missed) while it is being folded.
+    """
+
+    def __init__(self, directory, interval=1.0):
+        self.directory = directory
+        self.interval = interval
+        self._written = 0.0
+        self._lock = threading.Lock()
+        self._pid = None
+        self._worker = None
+
+    # Created Before fork() With A Preloaded App - Every Process Gets Its Own ID
+    @property
+    def worker(self):
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._worker = f'{self._pid}-{time.time():.6f}'
+        return self._worker
+
+    def flush(self, force=False):
+        now = time.monotonic()
+        if not force and now - self._written < self.interval:
+            return
+        with self._lock:
+            self._written = now
+            write_snapshot(os.path.join(self.directory, f'metrics-{os.getpid()}.json'),
+                           dict(registry.snapshot(), worker=self.worker))
+
+    def read_all(self):
+        paths = [path for path in glob.glob(os.path.join(self.directory, 'metrics-*.json'))
+                 if os.path.basename(path) != EXITED_SNAPSHOT]
+        workers = [read_snapshot(path) for path in paths]
+        exited = read_snapshot(os.path.join(self.directory, EXITED_SNAPSHOT)) or {}
+        folded = set(exited.get('folded', []))
+        # None: Removed Mid-Read, So Already In The Exited Snapshot Read After It
+        return [snapshot for snapshot in workers if snapshot is not None and snapshot.get('worker') not in folded] + [exited]
+
+# Written To A Temporary File & Renamed, So Readers Never See Half A Snapshot
+def write_snapshot(path, snapshot):
+    with open(f'{path}.tmp', 'w') as file:
+        json.dump(snapshot, file)
+    os.replace(f'{path}.tmp', path)
+
+def read_snapshot(path):
+    try:
+        with open(path) as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return None
+
+# Add An Exited Worker's Snapshot To metrics-exited.json, Then Remove It (Called By The gunicorn Master's child_exit)
+def fold_snapshot(directory, pid):
+    path = os.path.join(directory, f'metrics-{pid}.json')
+    snapshot = read_snapshot(path)
+    if snapshot is not None:
+        exited_path = os.path.join(directory, EXITED_SNAPSHOT)
+        exited = read_snapshot(exited_path) or {}
+        folded = exited.get('folded', []) + ([snapshot['worker']] if snapshot.get('worker') else [])
+        write_snapshot(exited_path, dict(to_snapshot(*merge_snapshots([exited, snapshot])), folded=folded[-FOLDED_HISTORY:]))
+    for leftover in (path, f'{path}.tmp'):
+        if os.path.exists(leftover):
+            os.remove(leftover)
+
+# Write This Process's Latest Numbers Before It Exits (Called By gunicorn's worker_exit)
+def flush_metrics(app):
+    writer = app.extensions.get('metrics_writer')
+    if writer is not None:
+        writer.flush(force=True)
+
+# Remove Snapshots Left By A Previous Run (Called Once By The gunicorn Master Before Workers Start)
+def clear_snapshots(directory):
+    for path in glob.glob(os.path.join(directory, 'metrics-*.json*')):
+        os.remove(path)
+
+def get_snapshots(app):
+    writer = app.extensions.get('metrics_writer')
+    if writer is None:
+        return [registry.snapshot()]
+    writer.flush(force=True)
+    return writer.read_all()
+
+def _request_metrics():
+    return request.environ.get(REQUEST_METRICS) if has_request_context() else None
+
+def _endpoint():
+    return request.endpoint or UNMATCHED
+
+# SQL Statement Count & Time Per Request, Plus Pool Checkout Wait (Timed Around Engine.raw_connection)
+def instrument_engine(engine):
+    @event.listens_for(engine, 'before_cursor_execute')
+    def _before_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault('app.query_started', []).append(time.perf_counter())
+
+    @event.listens_for(engine, 'after_cursor_execute')
+    def _after_execute(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info.get('app.query_started')
+        if not started:
+            return
+        elapsed = time.perf_counter() - started.pop()
+        stats = _request_metrics()
+        if stats is not None:
+            stats['statements'] += 1
+            stats['db_time'] += elapsed
+
+    @event.listens_for(engine, 'handle_error')
+    def _on_error(context):
+        started = context.connection.info.get('app.query_started') if context.connection is not None else None
+        if started:
+            started.pop()
+
+    raw_connection = engine.raw_connection
+
+    def timed_raw_connection():
+        started = time.perf_counter()
+        try:
+            return raw_connection()
+        finally:
+            if has_request_context():
+                registry.observe('app_db_pool_checkout_wait_seconds', {'endpoint': _endpoint()}, time.perf_counter() - started)
+
+    engine.raw_connection = timed_raw_connection
+
+def init_metrics(app):
+    if not app.config.get('METRICS_ENABLED', True):
+        return
+    directory = app.config.get('METRICS_DIR')
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+        app.extensions['metrics_writer'] = SnapshotWriter(directory, app.config.get('METRICS_FLUSH_INTERVAL', 1.0))
+
+    with app.app_context():
+        for engine in db.engines.values():
+            instrument_engine(engine)
+
+    @app.before_request
+    def _start_request_metrics():
+        request.environ[REQUEST_METRICS] = {'started': time.perf_counter(), 'statements': 0, 'db_time': 0.0}
+
+    @app.after_request
+    def _record_request_metrics(response):
+        stats = request.environ.pop(REQUEST_METRICS, None)
+        if stats is None:
+            return response
+        endpoint = _endpoint()
+        labels = {'endpoint': endpoint, 'method': request.method, 'status': str(response.status_code)}
+        registry.inc('app_http_requests_total', labels)
+        registry.observe('app_http_request_duration_seconds', labels, time.perf_counter() - stats['started'])
+        if not response.is_streamed:
+            registry.observe('app_http_response_size_bytes', {'endpoint': endpoint}, response.calculate_content_length() or 0)
+        registry.observe('app_db_statements_per_request', {'endpoint': endpoint}, stats['statements'])
+        registry.inc('app_db_statements_total', {'endpoint': endpoint}, stats['statements'])
+        registry.inc('app_db_time_seconds_total', {'endpoint': endpoint}, stats['db_time'])
+        writer = app.extensions.get('metrics_writer')
+        if writer is not None:
+            writer.flush()
+        return response
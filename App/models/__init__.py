@@ -1,3 +1,6 @@
 from .staff import *
 from .student import *
-from .review import *
\ No newline at end of file
+from .review import *
+from .rating_summary import *
+from .search_index import *
+from .leaderboard import *
\ No newline at end of file
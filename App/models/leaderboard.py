@@ -0,0 +1,51 @@
+from App.database import db
+
+class ReviewerStats(db.Model):
+    # Per Staff Review Aggregates (Staff.reviews) - Folded In Incrementally By The Leaderboard Refresher
+    __tablename__ = 'reviewer_stats'
+
+    # Attributes
+    staff_id = db.Column(db.Integer, db.ForeignKey('staff.id'), primary_key=True) # ForeignKey
+    review_count = db.Column(db.Integer, default=0, nullable=False)
+    rating_sum = db.Column(db.Integer, default=0, nullable=False)
+
+    def __repr__(self):
+        return f"<ReviewerStats: {self.staff_id} | {self.review_count} Reviews | Sum {self.rating_sum}>"
+
+class LeaderboardEntry(db.Model):
+    # One Ranked Row Of A Precomputed Leaderboard - Reading The Top N Is A Primary Key Range Scan
+    __tablename__ = 'leaderboard_entry'
+
+    # Attributes
+    board = db.Column(db.String(32), primary_key=True)
+    rank = db.Column(db.Integer, primary_key=True)
+    subject_id = db.Column(db.Integer, nullable=False) # Student ID Or Staff ID, Depending On The Board
+    review_count = db.Column(db.Integer, nullable=False)
+    rating_sum = db.Column(db.Integer, nullable=False)
+
+    # Works On A LeaderboardEntry Or Any Row With The Same Column Names
+    @staticmethod
+    def row_json(row):
+        return{
+            'rank': row.rank,
+            'review_count': row.review_count,
+            'average': round(row.rating_sum / row.review_count, 2) if row.review_count else None,
+        }
+
+    def __repr__(self):
+        return f"<LeaderboardEntry: {self.board} #{self.rank} | {self.subject_id}>"
+
+class LeaderboardState(db.Model):
+    # Single Row - How Far The Leaderboards Have Read The Review Table & When They Were Last Refreshed
+    __tablename__ = 'leaderboard_state'
+
+    # Attributes
+    id = db.Column(db.Integer, primary_key=True)
+    high_water_mark = db.Column(db.Integer, default=0, nullable=False) # Highest Review.id Folded In
+    refreshed_at = db.Column(db.DateTime, nullable=True) # UTC
+    rebuilt_at = db.Column(db.DateTime, nullable=True) # UTC, Last Full Rebuild
+    # Percentile Cutoffs (p0..p100) Of Each Metric, e.g. {"student_average": [1.0, ..., 5.0]}
+    percentiles = db.Column(db.JSON, nullable=True)
+
+    def __repr__(self):
+        return f"<LeaderboardState: High Water Mark {self.high_water_mark} | Refreshed {self.refreshed_at}>"
@@ -0,0 +1,49 @@
+from App.database import db
+
+RATING_VALUES = (1, 2, 3, 4, 5)
+
+class RatingSummary(db.Model):
+    # Denormalized Per Student Rating Aggregates - Kept Up To Date By The Review Controllers
+    __tablename__ = 'rating_summary'
+
+    # Attributes
+    student_id = db.Column(db.Integer, db.ForeignKey('student.student_id'), primary_key=True) # ForeignKey
+    review_count = db.Column(db.Integer, default=0, nullable=False)
+    rating_sum = db.Column(db.Integer, default=0, nullable=False)
+    rating_min = db.Column(db.Integer, nullable=True)
+    rating_max = db.Column(db.Integer, nullable=True)
+    # Histogram - Number Of Reviews With Each Rating From 1 To 5
+    rating_1 = db.Column(db.Integer, default=0, nullable=False)
+    rating_2 = db.Column(db.Integer, default=0, nullable=False)
+    rating_3 = db.Column(db.Integer, default=0, nullable=False)
+    rating_4 = db.Column(db.Integer, default=0, nullable=False)
+    rating_5 = db.Column(db.Integer, default=0, nullable=False)
+
+    def __init__(self, student_id):
+        self.student_id = student_id
+        self.review_count = 0
+        self.rating_sum = 0
+        for rating in RATING_VALUES:
+            setattr(self, f'rating_{rating}', 0)
+
+    @staticmethod
+    def histogram_column(rating):
+        return f'rating_{rating}' if rating in RATING_VALUES else None
+
+    # Works On A RatingSummary Or Any Row With The Same Column Names (None = No Reviews Yet)
+    @staticmethod
+    def row_json(row):
+        count = row.review_count if row is not None and row.review_count else 0
+        return{
+            'review_count': count,
+            'average': round(row.rating_sum / count, 2) if count else None,
+            'min': row.rating_min if count else None,
+            'max': row.rating_max if count else None,
+            'histogram': {str(rating): getattr(row, f'rating_{rating}') if count else 0 for rating in RATING_VALUES},
+        }
+
+    def get_json(self):
+        return dict(student_id=self.student_id, **RatingSummary.row_json(self))
+
+    def __repr__(self):
+        return f"<RatingSummary: {self.student_id} | {self.review_count} Reviews | Sum {self.rating_sum}>"
@@ -1,10 +1,15 @@
 from App.database import db
 
 class Review(db.Model):
+    # Indexes - (student_id, id) Serves Per Student Lookups & Listing In Review Order
+    __table_args__ = (
+        db.Index('ix_review_student_id_id', 'student_id', 'id'),
+    )
+
     # Attributes
     id = db.Column(db.Integer, primary_key=True)
     student_id = db.Column(db.Integer, db.ForeignKey('student.student_id'), nullable=False) # ForeignKey
-    reviewer_id = db.Column(db.Integer, db.ForeignKey('staff.id'), nullable=False) # ForeignKey
+    reviewer_id = db.Column(db.Integer, db.ForeignKey('staff.id'), nullable=False, index=True) # ForeignKey
     text = db.Column(db.String(120), nullable=False)
     rating = db.Column(db.Integer, nullable=False)
 
@@ -26,5 +31,15 @@ class Review(db.Model):
             'reviewer': f"{self.reviewer.prefix} {self.reviewer.firstname} {self.reviewer.lastname}"
         }
 
+    # Same Shape As get_json() For Column-Only Rows (No ORM Objects Or Lazy Loads)
+    @staticmethod
+    def row_json(row):
+        return{
+            'student_id': row.student_id,
+            'text': row.text,
+            'rating': row.rating,
+            'reviewer': f"{row.prefix} {row.firstname} {row.lastname}"
+        }
+
     def __repr__(self):
        return f"\n<Review: {self.text} \n Written By: {self.reviewer.prefix} {self.reviewer.firstname} {self.reviewer.lastname}>\n"
\ No newline at end of file
@@ -0,0 +1,86 @@
+from sqlalchemy import event, text
+from App.database import db
+
+# Full-Text Search Indexes Over Students & Review Text, Chosen By Dialect:
+# - SQLite:   external content FTS5 tables, kept in sync by triggers on student/review
+# - Postgres: expression GIN indexes (tsvector + pg_trgm), kept in sync by Postgres itself
+# Created With The Rest Of The Schema By db.create_all() (& By The Migration For Existing Databases)
+
+STUDENT_DOCUMENT = "firstname || ' ' || lastname || ' ' || email"
+
+SQLITE_CREATE = [
+    """CREATE VIRTUAL TABLE IF NOT EXISTS student_fts USING fts5(
+        firstname, lastname, email, content='student', content_rowid='student_id', prefix='2 3')""",
+    """CREATE VIRTUAL TABLE IF NOT EXISTS review_fts USING fts5(
+        text, content='review', content_rowid='id', prefix='2 3')""",
+    """CREATE TRIGGER IF NOT EXISTS student_fts_insert AFTER INSERT ON student BEGIN
+        INSERT INTO student_fts(rowid, firstname, lastname, email) VALUES (new.student_id, new.firstname, new.lastname, new.email);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS student_fts_delete AFTER DELETE ON student BEGIN
+        INSERT INTO student_fts(student_fts, rowid, firstname, lastname, email) VALUES ('delete', old.student_id, old.firstname, old.lastname, old.email);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS student_fts_update AFTER UPDATE OF firstname, lastname, email ON student BEGIN
+        INSERT INTO student_fts(student_fts, rowid, firstname, lastname, email) VALUES ('delete', old.student_id, old.firstname, old.lastname, old.email);
+        INSERT INTO student_fts(rowid, firstname, lastname, email) VALUES (new.student_id, new.firstname, new.lastname, new.email);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS review_fts_insert AFTER INSERT ON review BEGIN
+        INSERT INTO review_fts(rowid, text) VALUES (new.id, new.text);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS review_fts_delete AFTER DELETE ON review BEGIN
+        INSERT INTO review_fts(review_fts, rowid, text) VALUES ('delete', old.id, old.text);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS review_fts_update AFTER UPDATE OF text ON review BEGIN
+        INSERT INTO review_fts(review_fts, rowid, text) VALUES ('delete', old.id, old.text);
+        INSERT INTO review_fts(rowid, text) VALUES (new.id, new.text);
+    END""",
+]
+
+SQLITE_REBUILD = [
+    "INSERT INTO student_fts(student_fts) VALUES ('rebuild')",
+    "INSERT INTO review_fts(review_fts) VALUES ('rebuild')",
+]
+
+# Triggers Are Dropped Along With Their Tables
+SQLITE_DROP = [
+    "DROP TABLE IF EXISTS student_fts",
+    "DROP TABLE IF EXISTS review_fts",
+]
+
+POSTGRES_CREATE = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    f"CREATE INDEX IF NOT EXISTS ix_student_search_tsv ON student USING gin (to_tsvector('simple', {STUDENT_DOCUMENT}))",
+    f"CREATE INDEX IF NOT EXISTS ix_student_search_trgm ON student USING gin (({STUDENT_DOCUMENT}) gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_review_search_tsv ON review USING gin (to_tsvector('english', text))",
+]
+
+POSTGRES_DROP = [
+    "DROP INDEX IF EXISTS ix_student_search_tsv",
+    "DROP INDEX IF EXISTS ix_student_search_trgm",
+    "DROP INDEX IF EXISTS ix_review_search_tsv",
+]
+
+def _execute(connection, statements):
+    for statement in statements:
+        connection.execute(text(statement))
+
+def create_search_index(connection, rebuild=False):
+    if connection.dialect.name == 'sqlite':
+        _execute(connection, SQLITE_CREATE)
+        if rebuild:
+            _execute(connection, SQLITE_REBUILD)
+    elif connection.dialect.name == 'postgresql':
+        _execute(connection, POSTGRES_CREATE)
+
+def drop_search_index(connection):
+    if connection.dialect.name == 'sqlite':
+        _execute(connection, SQLITE_DROP)
+    elif connection.dialect.name == 'postgresql':
+        _execute(connection, POSTGRES_DROP)
+
+@event.listens_for(db.metadata, 'after_create')
+def _create_search_index(metadata, connection, **kw):
+    create_search_index(connection, rebuild=True)
+
+@event.listens_for(db.metadata, 'before_drop')
+def _drop_search_index(metadata, connection, **kw):
+    drop_search_index(connection)
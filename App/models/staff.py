@@ -1,5 +1,9 @@
-from werkzeug.security import check_password_hash, generate_password_hash
+from collections import namedtuple
 from App.database import db
+from App.hashing import hash_password, verify_password, password_needs_rehash
+
+# Detached, Read-Only Copy Of A Staff Row (What The Staff Cache Hands Out)
+StaffSnapshot = namedtuple('StaffSnapshot', ['id', 'prefix', 'firstname', 'lastname', 'email', 'is_admin', 'created_by_id'])
 
 class Staff(db.Model):
     # Attributes
@@ -39,10 +43,17 @@ class Staff(db.Model):
     def __repr__(self):
         return f"<Staff: {self.id} | {self.prefix} {self.firstname} {self.lastname} | {self.email} | Admin? {self.is_admin}>"
 
+    def snapshot(self):
+        return StaffSnapshot(self.id, self.prefix, self.firstname, self.lastname, self.email, self.is_admin, self.created_by_id)
+
     def set_password(self, password):
         """Create hashed password."""
-        self.password = generate_password_hash(password)
+        self.password = hash_password(password)
 
     def check_password(self, password):
         """Check hashed password."""
-        return check_password_hash(self.password, password)
\ No newline at end of file
+        return verify_password(self.password, password)
+
+    def password_needs_rehash(self):
+        """Check whether the stored hash uses outdated parameters."""
+        return password_needs_rehash(self.password)
\ No newline at end of file
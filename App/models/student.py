@@ -1,3 +1,4 @@
+from sqlalchemy import event
 from App.database import db
 
 class Student(db.Model):
@@ -6,6 +7,8 @@ class Student(db.Model):
     firstname = db.Column(db.String, nullable=False)
     lastname = db.Column(db.String, nullable=False)
     email =  db.Column(db.String, nullable=False, unique=True)
+    # Bumped Whenever The Student Or Their Reviews Change - Strong ETags Are Derived From It
+    version = db.Column(db.Integer, default=1, server_default='1', nullable=False)
 
     # Relationships
     reviews = db.relationship('Review', back_populates='reviewee', lazy=True)
@@ -15,6 +18,7 @@ class Student(db.Model):
         self.firstname = firstname
         self.lastname = lastname
         self.email = email
+        self.version = 1
 
     def get_json(self):
         return{
@@ -26,4 +30,9 @@ class Student(db.Model):
         }
 
     def __repr__(self):
-        return f"<Student: {self.student_id} | {self.firstname} {self.lastname} | {self.email} | {[review.text for review in self.reviews]}>"
\ No newline at end of file
+        return f"<Student: {self.student_id} | {self.firstname} {self.lastname} | {self.email} | {[review.text for review in self.reviews]}>"
+
+# Any ORM Update To A Student Bumps Its Version
+@event.listens_for(Student, 'before_update')
+def _bump_student_version(mapper, connection, student):
+    student.version = (student.version or 0) + 1
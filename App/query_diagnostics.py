@@ -0,0 +1,137 @@
+import logging, re, time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from flask import has_request_context, request
+from sqlalchemy import event
+from App.database import db, RoutingSession
+
+# Opt-In Query Diagnostics (QUERY_DIAGNOSTICS=True):
+# - Slow Query Log: Statements Slower Than SLOW_QUERY_THRESHOLD_MS, With Their Parameters & The View That Ran Them
+# - N+1 Detector: The Same Statement Shape Run N_PLUS_ONE_THRESHOLD+ Times In One Request, With The Relationship
+#   Whose Lazy Load Issued It. N_PLUS_ONE_STRICT=True Raises NPlusOneError Instead Of Logging (Used By App/tests)
+
+logger = logging.getLogger('App.queries')
+
+SCOPE = 'app.query_scope'
+RELATIONSHIP_OPTION = 'app_relationship'
+
+# Scope Opened With query_scope() Outside Of A Request (Scripts, Tests)
+_scope = ContextVar('query_scope', default=None)
+
+class NPlusOneError(AssertionError):
+    pass
+
+class QueryScope:
+    """Statement shapes seen while handling one request (or one query_scope() block)."""
+
+    def __init__(self, view):
+        self.view = view
+        self.shapes = Counter()
+        self.relationships = {}
+
+    def record(self, statement, relationship=None):
+        shape = ' '.join(statement.split())
+        self.shapes[shape] += 1
+        if relationship:
+            self.relationships[shape] = relationship
+
+    # [(Count, Shape, Relationship Or None)] For SELECT Shapes Repeated At Least `threshold` Times
+    def repeated(self, threshold):
+        return [(count, shape, self.relationships.get(shape)) for shape, count in self.shapes.most_common()
+                if count >= threshold and re.match(r'(SELECT|WITH)\b', shape, re.IGNORECASE)]
+
+@contextmanager
+def query_scope(view):
+    scope = QueryScope(view)
+    token = _scope.set(scope)
+    try:
+        yield scope
+    finally:
+        _scope.reset(token)
+
+def current_scope():
+    scope = _scope.get()
+    if scope is None and has_request_context():
+        scope = request.environ.get(SCOPE)
+    return scope
+
+def _view():
+    if has_request_context():
+        return request.endpoint or request.path
+    scope = _scope.get()
+    return scope.view if scope is not None else None
+
+class QueryDiagnostics:
+
+    def __init__(self, slow_query_ms=100, n_plus_one_threshold=5, strict=False):
+        self.slow_query_ms = slow_query_ms
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self.strict = strict
+
+    def instrument(self, engine):
+        @event.listens_for(engine, 'before_cursor_execute')
+        def _before_execute(conn, cursor, statement, parameters, context, executemany):
+            conn.info.setdefault('app.diagnostics_started', []).append(time.perf_counter())
+            scope = current_scope()
+            if scope is not None:
+                scope.record(statement, context.execution_options.get(RELATIONSHIP_OPTION) if context else None)
+
+        @event.listens_for(engine, 'after_cursor_execute')
+        def _after_execute(conn, cursor, statement, parameters, context, executemany):
+            started = conn.info.get('app.diagnostics_started')
+            if not started:
+                return
+            elapsed = (time.perf_counter() - started.pop()) * 1000
+            if self.slow_query_ms is not None and elapsed >= self.slow_query_ms:
+                logger.warning("Slow Query (%.1fms) In %s: %s | Parameters: %r",
+                               elapsed, _view() or 'No View', ' '.join(statement.split()), parameters)
+
+        @event.listens_for(engine, 'handle_error')
+        def _on_error(context):
+            started = context.connection.info.get('app.diagnostics_started') if context.connection is not None else None
+            if started:
+                started.pop()
+
+    # Log (Or In Strict Mode Raise) Every Repeated Statement Shape In The Scope - Returns Them
+    def check(self, scope):
+        repeated = scope.repeated(self.n_plus_one_threshold)
+        for count, shape, relationship in repeated:
+            message = (f"N+1 Suspected In {scope.view}: {count} x {shape}"
+                       + (f" (Lazy Load Of {relationship})" if relationship else ""))
+            if self.strict:
+                raise NPlusOneError(message)
+            logger.warning(message)
+        return repeated
+
+# Tag Statements Issued By Lazy/Relationship Loads With The Relationship (e.g. Review.reviewer)
+@event.listens_for(RoutingSession, 'do_orm_execute')
+def _tag_relationship_load(orm_execute_state):
+    if orm_execute_state.is_relationship_load and current_scope() is not None:
+        path = orm_execute_state.loader_strategy_path
+        if path is not None and len(path):
+            orm_execute_state.update_execution_options(**{RELATIONSHIP_OPTION: str(path[-1])})
+
+def init_query_diagnostics(app):
+    if not app.config.get('QUERY_DIAGNOSTICS', False):
+        return None
+    diagnostics = QueryDiagnostics(app.config.get('SLOW_QUERY_THRESHOLD_MS', 100),
+                                   app.config.get('N_PLUS_ONE_THRESHOLD', 5),
+                                   app.config.get('N_PLUS_ONE_STRICT', False))
+    app.extensions['query_diagnostics'] = diagnostics
+    with app.app_context():
+        for engine in db.engines.values():
+            diagnostics.instrument(engine)
+
+    @app.before_request
+    def _open_query_scope():
+        request.environ[SCOPE] = QueryScope(request.endpoint or request.path)
+
+    @app.after_request
+    def _check_query_scope(response):
+        scope = request.environ.pop(SCOPE, None)
+        if scope is not None:
+            diagnostics.check(scope)
+        return response
+
+    return diagnostics
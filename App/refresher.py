@@ -0,0 +1,65 @@
+import logging, os, threading
+from App.controllers.leaderboard import refresh_leaderboards
+
+# Keeps The Precomputed Leaderboards Fresh From A Daemon Thread In Each Serving Process (A Greenlet Under
+# The gevent Worker). It Starts On The First Request, So gunicorn Workers Forked From A Preloading Master Each
+# Run Their Own; refresh_leaderboards() Makes Them Safe To Run Side By Side. Not Started When TESTING
+
+logger = logging.getLogger(__name__)
+
+class LeaderboardRefresher:
+    """Calls refresh_leaderboards() every `interval` seconds until stopped."""
+
+    def __init__(self, app, interval):
+        self.app = app
+        self.interval = interval
+        self.last_result = None
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread = None
+        self._pid = None
+
+    # Start The Thread Unless It Is Already Running In This Process (A Forked Child Starts Its Own)
+    # The Event & Thread Are Created Here, After gevent Has Patched The Worker; start() Can Yield To Other
+    # Greenlets, So It Runs Outside The Lock
+    def ensure_running(self):
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            self._stopped = threading.Event()
+            self._thread = threading.Thread(target=self._run, name='leaderboard-refresher', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+
+    def refresh(self):
+        with self.app.app_context():
+            self.last_result = refresh_leaderboards()
+        return self.last_result
+
+    def _run(self):
+        while not self._stopped.is_set():
+            try:
+                result = self.refresh()
+                if result is not None and result['folded']:
+                    logger.info("Leaderboards Refreshed: %s", result)
+            except Exception as e:
+                logger.exception("Leaderboard Refresh Failed: %s", e)
+            self._stopped.wait(self.interval)
+
+def init_leaderboard_refresher(app):
+    interval = app.config.get('LEADERBOARD_REFRESH_INTERVAL', 60)
+    if app.config.get('TESTING') or not interval:
+        return None
+    refresher = LeaderboardRefresher(app, interval)
+    app.extensions['leaderboard_refresher'] = refresher
+
+    @app.before_request
+    def _start_leaderboard_refresher():
+        refresher.ensure_running()
+
+    return refresher
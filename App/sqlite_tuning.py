@@ -0,0 +1,100 @@
+import threading
+from sqlalchemy import event
+
+# Applied To Every New SQLite Connection (SQLITE_PRAGMAS Overrides These, {} Turns Tuning Off)
+# WAL Lets Readers Run Alongside The Single Writer & synchronous=NORMAL Only Fsyncs At Checkpoints
+DEFAULT_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'mmap_size': 256 * 1024 * 1024,
+    'cache_size': -64000,   # Negative = KiB, i.e. 64MB Per Connection
+    'busy_timeout': 5000,   # Milliseconds To Wait On Another Process's Lock Before "database is locked"
+    'temp_store': 'MEMORY',
+}
+
+READ_STATEMENTS = ('SELECT', 'PRAGMA', 'WITH', 'EXPLAIN')
+WRITE_LOCK_HELD = 'app.sqlite_write_lock'
+
+def is_write_statement(statement):
+    words = statement.split(None, 1)
+    return bool(words) and words[0].upper() not in READ_STATEMENTS
+
+def apply_pragmas(dbapi_connection, pragmas):
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in pragmas.items():
+            cursor.execute(f'PRAGMA {name}={value}')
+    finally:
+        cursor.close()
+
+class WriteSerializer:
+    """Process-wide write lock for one SQLite engine.
+
+    SQLite allows a single writer per database. Instead of every thread/greenlet racing for
+    the file lock (and failing with "database is locked" once busy_timeout runs out), each
+    connection takes this lock before its first write statement and releases it when its
+    transaction commits or rolls back, so writers in this process queue up in order.
+    (The engine's commit event fires just before the COMMIT itself, and busy_timeout covers
+    that short overlap with the next writer.)
+    If the lock cannot be had within `timeout` seconds the write goes ahead anyway and SQLite's
+    own busy handling takes over, so a thread writing on two connections cannot deadlock itself.
+    """
+
+    def __init__(self, timeout=5.0):
+        self.timeout = timeout
+        self.lock = threading.Lock()
+        self.waits = 0
+        self.timeouts = 0
+
+    def acquire(self, connection):
+        if connection.info.get(WRITE_LOCK_HELD) is not None:
+            return
+        acquired = self.lock.acquire(blocking=False)
+        if not acquired:
+            self.waits += 1
+            acquired = self.lock.acquire(timeout=self.timeout)
+            self.timeouts += not acquired
+        connection.info[WRITE_LOCK_HELD] = acquired
+
+    def release(self, connection):
+        if connection.info.pop(WRITE_LOCK_HELD, None):
+            self.lock.release()
+
+    # A New Lock - After fork() (Nothing Holds It In The Child) Or Once gevent Has Patched threading,
+    # So Waiting Greenlets Yield Instead Of Blocking The Whole Worker
+    def reset(self):
+        self.lock = threading.Lock()
+
+    def install(self, engine):
+        @event.listens_for(engine, 'before_cursor_execute')
+        def _before_write(conn, cursor, statement, parameters, context, executemany):
+            if is_write_statement(statement):
+                self.acquire(conn)
+
+        @event.listens_for(engine, 'commit')
+        def _after_commit(conn):
+            self.release(conn)
+
+        @event.listens_for(engine, 'rollback')
+        def _after_rollback(conn):
+            self.release(conn)
+
+        # Safety Net - A Connection Returned To The Pool Never Keeps The Lock
+        @event.listens_for(engine, 'checkin')
+        def _on_checkin(dbapi_connection, connection_record):
+            if connection_record.info.pop(WRITE_LOCK_HELD, None):
+                self.lock.release()
+
+# Apply The Pragmas On Connect & (Optionally) Serialize This Process's Writes - Returns The WriteSerializer
+def tune_sqlite_engine(engine, pragmas=None, serialize_writes=True):
+    pragmas = DEFAULT_PRAGMAS if pragmas is None else pragmas
+    if pragmas:
+        @event.listens_for(engine, 'connect')
+        def _on_connect(dbapi_connection, connection_record):
+            apply_pragmas(dbapi_connection, pragmas)
+
+    if not serialize_writes:
+        return None
+    serializer = WriteSerializer(timeout=pragmas.get('busy_timeout', 5000) / 1000)
+    serializer.install(engine)
+    return serializer
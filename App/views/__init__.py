@@ -1,5 +1,7 @@
 from .index import index_views
 from .auth import auth_views
 from .staff import staff_views
+from .monitoring import monitoring_views
+from .leaderboard import leaderboard_views
 
-views = [staff_views, index_views, auth_views] 
\ No newline at end of file
+views = [staff_views, index_views, auth_views, monitoring_views, leaderboard_views] 
\ No newline at end of file
@@ -1,3 +1,4 @@
+import logging
 from flask import Blueprint, jsonify, request
 from flask_jwt_extended import unset_jwt_cookies
 
@@ -5,6 +6,8 @@ from App.controllers import (
     login
 )
 
+logger = logging.getLogger(__name__)
+
 auth_views = Blueprint('auth_views', __name__, template_folder='../templates')
 
 """Login"""
@@ -24,7 +27,7 @@ def login_action():
         return jsonify(access_token=token), 200
 
     except Exception as e:
-        print(f"Error: {e}")
+        logger.exception("Error: %s", e)
         return jsonify(error="An Error Occurred While Logging In"), 500
 
 """Logout"""
@@ -36,5 +39,5 @@ def logout_action():
         return response, 200
 
     except Exception as e:
-        print(f"Error: {e}")
+        logger.exception("Error: %s", e)
         return jsonify(error="An Error Occurred While Logging Out"), 500
@@ -0,0 +1,27 @@
+import hashlib
+from flask import current_app, jsonify, request
+
+# Conditional GETs For Per Student Reads - The Strong ETag Combines The Student's Version
+# (Bumped On Every Student/Review Write & Reviewer Rename) With The Request's Path & Query, So A Matching
+# If-None-Match Is Answered With A 304 After Only The Version Lookup
+
+def student_etag(student_id, version):
+    variant = hashlib.sha1(request.full_path.encode()).hexdigest()[:12]
+    return f"{student_id}-{version}-{variant}"
+
+def _cache_headers(response, etag):
+    response.set_etag(etag)
+    cache_control = current_app.config.get('HTTP_CACHE_CONTROL')
+    if cache_control:
+        response.headers['Cache-Control'] = cache_control
+    return response
+
+# Returns A 304 If The Client's Copy Is Current, Otherwise make_response() - Both With ETag & Cache-Control
+def conditional_student_response(student_id, version, make_response):
+    etag = student_etag(student_id, version)
+    if request.if_none_match.contains(etag):
+        return _cache_headers(current_app.response_class(status=304), etag)
+    return _cache_headers(make_response(), etag)
+
+def conditional_student_json(student_id, version, build):
+    return conditional_student_response(student_id, version, lambda: jsonify(build()))
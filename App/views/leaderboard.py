@@ -0,0 +1,130 @@
+import logging
+from flask import Blueprint, current_app, jsonify, request
+from flask_jwt_extended import jwt_required, current_user as jwt_current_user
+
+from App.controllers import (
+    get_leaderboard_json,
+    get_leaderboard_percentiles_json,
+    get_student_standing_json,
+    get_reviewer_standing_json,
+    DEFAULT_PERCENTILES,
+)
+
+logger = logging.getLogger(__name__)
+
+leaderboard_views = Blueprint('leaderboard_views', __name__, template_folder='../templates')
+
+STUDENT_ORDERS = {'top': 'top_students', 'bottom': 'bottom_students'}
+
+# Admin Staff Only - None If Allowed, Else The Error Response
+def admin_only():
+    if not jwt_current_user.is_admin:
+        return jsonify(error="Not Authorized To View Leaderboards. Admin Staff Only."), 403
+    return None
+
+# ?limit= Between 1 & LEADERBOARD_SIZE (Default 10) - None If Invalid
+def leaderboard_limit():
+    limit = request.args.get('limit', type=int) if 'limit' in request.args else 10
+    return limit if limit is not None and 1 <= limit <= current_app.config.get('LEADERBOARD_SIZE', 100) else None
+
+"""Student Leaderboard""" # GET /admin/leaderboards/students?order=top|bottom&limit=10 - Highest/Lowest Average Rating
+@leaderboard_views.route('/admin/leaderboards/students', methods=['GET'])
+@jwt_required()
+def student_leaderboard():
+    try:
+        denied = admin_only()
+        if denied:
+            return denied
+
+        board = STUDENT_ORDERS.get(request.args.get('order', 'top'))
+        if board is None:
+            return jsonify(error="Leaderboard 'order' Must Be One Of: top, bottom."), 400
+        limit = leaderboard_limit()
+        if limit is None:
+            return jsonify(error=f"Invalid 'limit', Expected 1 To {current_app.config.get('LEADERBOARD_SIZE', 100)}."), 400
+
+        return jsonify(get_leaderboard_json(board, limit)), 200
+
+    except Exception as e:
+        logger.exception("Error: %s", e)
+        return jsonify(error="An Error Occurred While Getting The Student Leaderboard."), 500
+
+"""Reviewer Leaderboard""" # GET /admin/leaderboards/reviewers?limit=10 - Most Reviews Written
+@leaderboard_views.route('/admin/leaderboards/reviewers', methods=['GET'])
+@jwt_required()
+def reviewer_leaderboard():
+    try:
+        denied = admin_only()
+        if denied:
+            return denied
+
+        limit = leaderboard_limit()
+        if limit is None:
+            return jsonify(error=f"Invalid 'limit', Expected 1 To {current_app.config.get('LEADERBOARD_SIZE', 100)}."), 400
+
+        return jsonify(get_leaderboard_json('active_reviewers', limit)), 200
+
+    except Exception as e:
+        logger.exception("Error: %s", e)
+        return jsonify(error="An Error Occurred While Getting The Reviewer Leaderboard."), 500
+
+"""Leaderboard Percentiles""" # GET /admin/leaderboards/percentiles?p=50,90,99 - Student Averages & Reviewer Activity
+@leaderboard_views.route('/admin/leaderboards/percentiles', methods=['GET'])
+@jwt_required()
+def leaderboard_percentiles():
+    try:
+        denied = admin_only()
+        if denied:
+            return denied
+
+        if 'p' in request.args:
+            try:
+                percentiles = [int(p) for p in request.args['p'].split(',') if p.strip()]
+            except ValueError:
+                percentiles = []
+            if not percentiles or any(not 0 <= p <= 100 for p in percentiles):
+                return jsonify(error="Percentiles 'p' Must Be Whole Numbers From 0 To 100, e.g. p=50,90,99."), 400
+        else:
+            percentiles = DEFAULT_PERCENTILES
+
+        return jsonify(get_leaderboard_percentiles_json(percentiles)), 200
+
+    except Exception as e:
+        logger.exception("Error: %s", e)
+        return jsonify(error="An Error Occurred While Getting The Leaderboard Percentiles."), 500
+
+"""Student Standing""" # GET /admin/leaderboards/students/<id> - The Percentile Of A Student's Average Rating
+@leaderboard_views.route('/admin/leaderboards/students/<int:student_id>', methods=['GET'])
+@jwt_required()
+def student_standing(student_id):
+    try:
+        denied = admin_only()
+        if denied:
+            return denied
+
+        standing = get_student_standing_json(student_id)
+        if standing is None:
+            return jsonify(error=f'Student With ID: {student_id} Not Found'), 404
+        return jsonify(standing), 200
+
+    except Exception as e:
+        logger.exception("Error: %s", e)
+        return jsonify(error=f"An Error Occurred While Getting The Standing Of Student With ID: {student_id}"), 500
+
+"""Reviewer Standing""" # GET /admin/leaderboards/reviewers/<id> - The Percentile Of A Staff's Review Count
+@leaderboard_views.route('/admin/leaderboards/reviewers/<int:staff_id>', methods=['GET'])
+@jwt_required()
+def reviewer_standing(staff_id):
+    try:
+        denied = admin_only()
+        if denied:
+            return denied
+
+        standing = get_reviewer_standing_json(staff_id)
+        if standing is None:
+            return jsonify(error=f'Staff With ID: {staff_id} Not Found'), 404
+        return jsonify(standing), 200
+
+    except Exception as e:
+        logger.exception("Error: %s", e)
+        return jsonify(error=f"An Error Occurred While Getting The Standing Of Staff With ID: {staff_id}"), 500
@@ -0,0 +1,33 @@
+import logging, time
+from flask import Blueprint, current_app, jsonify
+from sqlalchemy import text
+
+from App.database import db
+from App.metrics import get_snapshots, render
+
+logger = logging.getLogger(__name__)
+
+monitoring_views = Blueprint('monitoring_views', __name__, template_folder='../templates')
+
+"""Metrics""" # Prometheus Text Format - Summed Across Every Worker Writing To METRICS_DIR
+@monitoring_views.route('/metrics', methods=['GET'])
+def metrics():
+    body = render(get_snapshots(current_app))
+    return current_app.response_class(body, mimetype='text/plain', content_type='text/plain; version=0.0.4; charset=utf-8')
+
+"""Health Check""" # Round Trip Latency Of A SELECT 1 On The Primary & Every Replica - 503 If Any Of Them Fails
+@monitoring_views.route('/healthcheck', methods=['GET'])
+def healthcheck():
+    databases, healthy = {}, True
+    for key, engine in db.engines.items():
+        name = key or 'primary'
+        started = time.perf_counter()
+        try:
+            with engine.connect() as connection:
+                connection.execute(text('SELECT 1'))
+            databases[name] = {'status': 'ok', 'latency_ms': round((time.perf_counter() - started) * 1000, 3)}
+        except Exception as e:
+            logger.error("Health Check Failed For %s: %s", name, e)
+            databases[name] = {'status': 'error', 'error': type(e).__name__}
+            healthy = False
+    return jsonify(status='ok' if healthy else 'error', databases=databases), 200 if healthy else 503
@@ -1,19 +1,48 @@
-from flask import Blueprint, jsonify, request
+import json, logging
+from flask import Blueprint, current_app, jsonify, request
 from flask_jwt_extended import jwt_required, current_user as jwt_current_user
 
 from App.controllers import (
     create_staff,
     get_student,
     get_student_json,
+    get_students_json,
+    get_student_version,
     add_student,
     add_review,
+    parse_rating,
     is_valid_student_id,
-    get_student_reviews_json,
+    get_student_reviews_page_json,
+    iter_student_reviews_json,
+    get_rating_summary_json,
+    bulk_add_students,
+    RowLimitExceeded,
+    bulk_add_reviews,
+    search,
+    SEARCH_TYPES,
+    iter_reviews_export,
+    EXPORT_FORMATS,
     jwt_required
 )
 
+from App.json_provider import NDJSON_MIMETYPE, ndjson_response, streamed_response
+from .conditional import conditional_student_json, conditional_student_response
+
+logger = logging.getLogger(__name__)
+
 staff_views = Blueprint('staff_views', __name__, template_folder='../templates')
 
+# Parse A Streamed NDJSON Body Line By Line - Malformed Lines Become Empty (Invalid) Rows
+def read_ndjson(stream):
+    for line in stream:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except ValueError:
+            yield {}
+
 """Create Staff""" # Admin Staff vs Regular Staff
 @staff_views.route('/create_staff', methods=['POST'])
 @jwt_required()
@@ -43,7 +72,7 @@ def create_new_staff():
         return jsonify(message=message), 201
 
     except Exception as e:
-        print(f"Error while creating staff: {e}")
+        logger.exception("Error while creating staff: %s", e)
         return jsonify(error="An Error Occurred While Creating The Staff."), 500
 
 """Add Student""" # Requirement #1
@@ -71,9 +100,45 @@ def add_new_student():
         return jsonify(message=message), 201
 
     except Exception as e:
-        print(f"Error While Adding Student: {e}")
+        logger.exception("Error While Adding Student: %s", e)
         return jsonify(error="An Error Occurred While Adding The New Student."), 500
 
+def count_statuses(results):
+    counts = {status: 0 for status in ('created', 'duplicate', 'invalid', 'failed')}
+    for result in results:
+        counts[result['status']] += 1
+    return counts
+
+"""Add Students""" # Bulk - JSON Array Or NDJSON (application/x-ndjson), One Result Per Row
+@staff_views.route('/add_students', methods=['POST'])
+@jwt_required()
+def add_new_students():
+    try:
+        max_items = current_app.config.get('STUDENT_BATCH_MAX_ITEMS', 10000)
+        too_many = f"Too Many Students In One Request, The Maximum Is {max_items}."
+        if request.mimetype == 'application/x-ndjson':
+            rows = read_ndjson(request.stream)
+        else:
+            rows = request.get_json(silent=True)
+            if not isinstance(rows, list):
+                return jsonify(error="Expected A JSON Array Or NDJSON Of Students."), 400
+            if len(rows) > max_items:
+                return jsonify(error=too_many), 413
+
+        # NDJSON Is Streamed - Each Chunk Is Committed As It Arrives, Until The Rows Pass STUDENT_BATCH_MAX_ITEMS
+        try:
+            results = bulk_add_students(rows, max_rows=max_items)
+        except RowLimitExceeded as e:
+            return jsonify(error=f"{too_many} Only The Rows In results Were Handled.",
+                           results=e.results, **count_statuses(e.results)), 413
+
+        counts = count_statuses(results)
+        return jsonify(results=results, **counts), 200
+
+    except Exception as e:
+        logger.exception("Error While Adding Students: %s", e)
+        return jsonify(error="An Error Occurred While Adding The Students."), 500
+
 """Review Student""" # Requirement #2
 @staff_views.route('/review/<int:student_id>', methods=['POST'])
 @jwt_required()
@@ -88,6 +153,9 @@ def review_student(student_id):
         if not text or not rating:
             return jsonify(error="Text And Rating Are Required."), 400
 
+        if parse_rating(rating) is None:
+            return jsonify(error="Rating Must Be A Whole Number From 1 To 5."), 400
+
         if not is_valid_student_id(student_id):
             return jsonify(error="Invalid Student ID, Please Try Again."), 400
 
@@ -103,10 +171,34 @@ def review_student(student_id):
         return jsonify(message=message), 201
 
     except Exception as e:
-        print(f"Error: {e}")
+        logger.exception("Error: %s", e)
         return jsonify(error="An Error Occurred While Reviewing The Student."), 500
 
-"""Search Student""" # Requirement #3
+"""Review Students (Batch)""" # Many {student_id, text, rating} Items By The Current Reviewer, One Transaction
+@staff_views.route('/reviews/batch', methods=['POST'])
+@jwt_required()
+def review_students_batch():
+    try:
+        items = request.get_json(silent=True)
+        if not isinstance(items, list) or not items:
+            return jsonify(error="Expected A Non-Empty JSON Array Of Reviews."), 400
+
+        max_items = current_app.config.get('REVIEW_BATCH_MAX_ITEMS', 1000)
+        if len(items) > max_items:
+            return jsonify(error=f"Too Many Reviews In One Batch, The Maximum Is {max_items}."), 413
+
+        results = bulk_add_reviews(items, jwt_current_user.id)
+        counts = {status: 0 for status in ('created', 'invalid', 'not_found')}
+        for result in results:
+            counts[result['status']] += 1
+
+        return jsonify(results=results, **counts), 200
+
+    except Exception as e:
+        logger.exception("Error: %s", e)
+        return jsonify(error="An Error Occurred While Reviewing The Students."), 500
+
+"""Search Student""" # Requirement #3 - Conditional GET (ETag / If-None-Match)
 @staff_views.route('/search/<int:student_id>', methods=['GET'])
 @jwt_required()
 def search_student(student_id):
@@ -114,16 +206,80 @@ def search_student(student_id):
         if not is_valid_student_id(student_id):
             return jsonify(error="Invalid Student ID, Please Try Again."), 400
 
-        student = get_student_json(student_id)
-        if not student:
+        version = get_student_version(student_id)
+        if version is None:
             return jsonify(error=f'Student With ID: {student_id} Not Found'), 404
 
-        return jsonify(student), 200
+        return conditional_student_json(student_id, version, lambda: get_student_json(student_id, summary=True))
 
     except Exception as e:
         return jsonify(error=f'An Error Occurred While Searching For Student With ID: {student_id}'), 500
 
-"""View Student Reviews""" # Requirement #4
+"""Full-Text Search""" # GET /search?q=<words>&type=students|reviews|all&limit=&offset= - Ranked, Prefix Matching
+@staff_views.route('/search', methods=['GET'])
+@jwt_required()
+def full_text_search():
+    try:
+        query = request.args.get('q', '').strip()
+        if not query:
+            return jsonify(error="A Search Query 'q' Is Required."), 400
+
+        kind = request.args.get('type', 'all')
+        types = SEARCH_TYPES if kind == 'all' else (kind,)
+        if any(search_type not in SEARCH_TYPES for search_type in types):
+            return jsonify(error="Search 'type' Must Be One Of: students, reviews, all."), 400
+
+        limit = request.args.get('limit', type=int)
+        offset = request.args.get('offset', 0, type=int)
+        if ('limit' in request.args and (limit is None or limit < 1)) or offset < 0:
+            return jsonify(error="Invalid Pagination Parameters, 'limit' Must Be Positive And 'offset' Not Negative."), 400
+
+        return jsonify(query=query, **search(query, types, limit, offset)), 200
+
+    except Exception as e:
+        logger.exception("Error: %s", e)
+        return jsonify(error="An Error Occurred While Searching."), 500
+
+"""Search Students""" # Many At Once: GET /students?ids=816000001,816000002 Or POST {"ids": [...]}
+@staff_views.route('/students', methods=['GET', 'POST'])
+@jwt_required()
+def search_students():
+    try:
+        if request.method == 'POST':
+            data = request.get_json(silent=True) or {}
+            ids = data.get('ids') if isinstance(data, dict) else None
+            if not isinstance(ids, list):
+                return jsonify(error="Expected A JSON Body With A List Of 'ids'."), 400
+        else:
+            ids = [id for value in request.args.getlist('ids') for id in value.split(',') if id.strip()]
+
+        if not ids:
+            return jsonify(error="At Least One Student ID Is Required."), 400
+
+        max_ids = current_app.config.get('STUDENTS_LOOKUP_MAX_IDS', 500)
+        if len(ids) > max_ids:
+            return jsonify(error=f"Too Many Student IDs, The Maximum Is {max_ids}."), 413
+
+        valid_ids, invalid = [], []
+        for id in ids:
+            try:
+                student_id = int(str(id).strip())
+            except ValueError:
+                student_id = None
+            if student_id is not None and is_valid_student_id(student_id):
+                valid_ids.append(student_id)
+            else:
+                invalid.append(id)
+
+        students, missing = get_students_json(valid_ids)
+        return jsonify(students={str(student_id): student for student_id, student in students.items()},
+                       missing=missing, invalid=invalid), 200
+
+    except Exception as e:
+        logger.exception("Error: %s", e)
+        return jsonify(error="An Error Occurred While Searching For The Students."), 500
+
+"""View Student Reviews""" # Requirement #4 - Paginated: ?limit=<page size>&after=<next cursor>, Conditional GET
 @staff_views.route('/list_reviews/<int:student_id>', methods=['GET'])
 @jwt_required()
 def list_student_reviews(student_id):
@@ -131,13 +287,64 @@ def list_student_reviews(student_id):
         if not is_valid_student_id(student_id):
             return jsonify(error="Invalid Student ID, Please Try Again."), 400
 
-        student = get_student(student_id)
-        if not student:
+        limit = request.args.get('limit', type=int)
+        after = request.args.get('after', type=int)
+        if ('limit' in request.args and (limit is None or limit < 1)) or ('after' in request.args and after is None):
+            return jsonify(error="Invalid Pagination Parameters, 'limit' Must Be A Positive Integer And 'after' A Review ID."), 400
+
+        version = get_student_version(student_id)
+        if version is None:
+            return jsonify(error=f'Student With ID: {student_id} Not Found'), 404
+
+        # ?format=ndjson Streams Every Review, One JSON Object Per Line, Straight From A Server-Side Cursor
+        if request.args.get('format') == 'ndjson':
+            return conditional_student_response(student_id, version, lambda: ndjson_response(iter_student_reviews_json(student_id)))
+
+        return conditional_student_json(student_id, version, lambda: get_student_reviews_page_json(student_id, limit, after)) # Extra Support!
+
+    except Exception as e:
+        logger.exception("Error: %s", e)
+        return jsonify(error=f"An Error Occurred While Getting Reviews For Student With ID:{student_id}"), 500
+
+"""Student Rating Summary""" # Count, Average, Min, Max & Histogram - Maintained On Write
+@staff_views.route('/summary/<int:student_id>', methods=['GET'])
+@jwt_required()
+def student_rating_summary(student_id):
+    try:
+        if not is_valid_student_id(student_id):
+            return jsonify(error="Invalid Student ID, Please Try Again."), 400
+
+        version = get_student_version(student_id)
+        if version is None:
             return jsonify(error=f'Student With ID: {student_id} Not Found'), 404
 
-        student_reviews = get_student_reviews_json(student_id)
-        return jsonify(student_reviews), 200 # Extra Support!
+        return conditional_student_json(student_id, version, lambda: get_rating_summary_json(student_id))
+
+    except Exception as e:
+        logger.exception("Error: %s", e)
+        return jsonify(error=f"An Error Occurred While Getting The Rating Summary For Student With ID:{student_id}"), 500
+
+"""Export Reviews""" # Admin Staff Only - Streams Every Review (Optionally Of One Reviewer/Student) As CSV Or NDJSON
+@staff_views.route('/export/reviews', methods=['GET'])
+@jwt_required()
+def export_reviews():
+    try:
+        if not jwt_current_user.is_admin:
+            return jsonify(error="Not Authorized To Export Reviews. Admin Staff Only."), 403
+
+        format = request.args.get('format', 'csv')
+        if format not in EXPORT_FORMATS:
+            return jsonify(error=f"Invalid Format, Expected One Of: {', '.join(EXPORT_FORMATS)}."), 400
+
+        reviewer_id = request.args.get('reviewer', type=int)
+        student_id = request.args.get('student', type=int)
+        if ('reviewer' in request.args and reviewer_id is None) or ('student' in request.args and student_id is None):
+            return jsonify(error="Invalid Filter, 'reviewer' And 'student' Must Be IDs."), 400
+
+        mimetype = 'text/csv' if format == 'csv' else NDJSON_MIMETYPE
+        headers = {'Content-Disposition': f'attachment; filename=reviews.{format}'}
+        return streamed_response(iter_reviews_export(format, reviewer_id, student_id), mimetype, headers=headers)
 
     except Exception as e:
-        print(f"Error: {e}")
-        return jsonify(error=f"An Error Occurred While Getting Reviews For Student With ID:{student_id}"), 500
\ No newline at end of file
+        logger.exception("Error: %s", e)
+        return jsonify(error="An Error Occurred While Exporting Reviews."), 500
@@ -0,0 +1,83 @@
+"""Shared helpers for the scripts in benchmarks/.
+
+Benchmarks build the real app through ``create_app`` against a throwaway
+database and seed it with core (executemany) inserts, which is much faster
+than going through the controllers.
+"""
+import json, os, random, statistics, sys, time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask_jwt_extended import create_access_token
+from sqlalchemy import insert
+
+from App.main import create_app
+from App.database import db
+from App.models import Staff, Student, Review
+
+FIRST_STUDENT_ID = 816000000
+SEED_BATCH_SIZE = 10000
+
+def build_app(database_uri, overrides=None):
+    config = {'TESTING': True, 'SQLALCHEMY_DATABASE_URI': database_uri}
+    config.update(overrides or {})
+    app = create_app(config)
+    db.drop_all()
+    db.create_all()
+    return app
+
+def seed(students=1000, staff=10, reviews=10000, seed_value=42):
+    """Seed students, staff and reviews, returning (student_ids, staff_ids)."""
+    rng = random.Random(seed_value)
+    password = Staff('Mr.', 'Bench', 'Mark', 'bench@mail.com', True, 'benchpass', None).password
+
+    staff_rows = [{'id': i + 1, 'prefix': 'Dr.', 'firstname': f'Staff{i}', 'lastname': 'Bench',
+                   'email': f'staff{i}@mail.com', 'is_admin': i == 0, 'password': password,
+                   'created_by_id': None} for i in range(staff)]
+    db.session.execute(insert(Staff.__table__), staff_rows)
+
+    student_ids = [FIRST_STUDENT_ID + i for i in range(students)]
+    for start in range(0, students, SEED_BATCH_SIZE):
+        db.session.execute(insert(Student.__table__), [
+            {'student_id': sid, 'firstname': f'First{sid}', 'lastname': f'Last{sid}', 'email': f'{sid}@mail.com'}
+            for sid in student_ids[start:start + SEED_BATCH_SIZE]])
+
+    for start in range(0, reviews, SEED_BATCH_SIZE):
+        db.session.execute(insert(Review.__table__), [
+            {'student_id': rng.choice(student_ids), 'reviewer_id': rng.randint(1, staff),
+             'text': f'Review {n} written for benchmarking', 'rating': rng.randint(1, 5)}
+            for n in range(start, min(start + SEED_BATCH_SIZE, reviews))])
+    db.session.commit()
+    return student_ids, [row['id'] for row in staff_rows]
+
+def auth_headers(staff_id):
+    return {'Authorization': f'Bearer {create_access_token(identity=staff_id)}'}
+
+def timed(fn, *args, **kwargs):
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return (time.perf_counter() - start) * 1000, result
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered) + 0.5)) - 1))
+    return ordered[index]
+
+def summarize(samples):
+    """Latency summary (milliseconds) for a list of samples."""
+    return {
+        'count': len(samples),
+        'mean': statistics.fmean(samples) if samples else 0.0,
+        'p50': percentile(samples, 50),
+        'p95': percentile(samples, 95),
+        'p99': percentile(samples, 99),
+        'max': max(samples) if samples else 0.0,
+    }
+
+def write_results(path, results):
+    if path:
+        with open(path, 'w') as output:
+            json.dump(results, output, indent=2, default=str)
+    print(json.dumps(results, indent=2, default=str))
@@ -0,0 +1,69 @@
+"""Encode time and peak memory for a large list of reviews.
+
+Seeds one student with N reviews (100k by default), then - each in a fresh
+subprocess so peak RSS is not shared - serializes every review with:
+
+    stdlib   Flask's default JSON provider, one jsonify() of the whole list
+    orjson   App.json_provider.FastJSONProvider, one jsonify() of the whole list
+    ndjson   the streamed /list_reviews/<id>?format=ndjson response
+
+    python benchmarks/json_encoding.py --reviews 100000
+"""
+import argparse, json, resource, subprocess, sys, time
+
+from common import FIRST_STUDENT_ID, build_app, seed, auth_headers, write_results
+
+MODES = ('stdlib', 'orjson', 'ndjson')
+
+def peak_rss_mb():
+    # ru_maxrss Is In Kilobytes On Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+def measure(database_url, mode):
+    from flask import jsonify
+    from flask.json.provider import DefaultJSONProvider
+    from App.main import create_app
+    from App.controllers import get_student_reviews_json
+
+    app = create_app({'TESTING': True, 'SQLALCHEMY_DATABASE_URI': database_url})
+    if mode == 'stdlib':
+        app.json = DefaultJSONProvider(app)
+    baseline = peak_rss_mb()
+
+    start = time.perf_counter()
+    if mode == 'ndjson':
+        response = app.test_client().get(f'/list_reviews/{FIRST_STUDENT_ID}?format=ndjson', headers=auth_headers(1),
+                                         buffered=False)
+        size = sum(len(chunk) for chunk in response.response)
+        response.close()
+    else:
+        with app.test_request_context():
+            size = len(jsonify(get_student_reviews_json(FIRST_STUDENT_ID)).get_data())
+    elapsed = (time.perf_counter() - start) * 1000
+
+    return {'encode_ms': elapsed, 'bytes': size, 'baseline_rss_mb': baseline,
+            'peak_rss_mb': peak_rss_mb(), 'rss_growth_mb': peak_rss_mb() - baseline}
+
+def run(args):
+    build_app(args.database_url)
+    seed(students=1, staff=args.staff, reviews=args.reviews)
+
+    results = {'reviews': args.reviews}
+    for mode in MODES:
+        output = subprocess.run([sys.executable, __file__, '--database-url', args.database_url, '--measure', mode],
+                                check=True, capture_output=True, text=True).stdout
+        results[mode] = json.loads(output.strip().splitlines()[-1])
+    return results
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--database-url', default='sqlite:////tmp/json-encoding-bench.db')
+    parser.add_argument('--reviews', type=int, default=100_000)
+    parser.add_argument('--staff', type=int, default=50)
+    parser.add_argument('--measure', choices=MODES, help=argparse.SUPPRESS)
+    parser.add_argument('--output', help='Write the results as JSON to this file')
+    args = parser.parse_args()
+    if args.measure:
+        print(json.dumps(measure(args.database_url, args.measure)))
+    else:
+        write_results(args.output, run(args))
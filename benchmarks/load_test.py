@@ -0,0 +1,173 @@
+"""HTTP load test: a mixed login/search/list_reviews/review workload.
+
+Builds the app with ``create_app(overrides)``, seeds it, serves it with
+gevent's WSGI server (as the gunicorn gevent worker does) and drives a
+weighted mix of requests from --concurrency greenlets for --duration
+seconds. Reports requests/second and p50/p95/p99 latency per endpoint.
+
+Save a run as the baseline, then compare later runs against it - the
+script exits with status 1 when an endpoint's p95 latency or throughput
+regresses by more than --tolerance:
+
+    python benchmarks/load_test.py --concurrency 20 --duration 30 --save-baseline benchmarks/baseline.json
+    python benchmarks/load_test.py --concurrency 20 --duration 30 --baseline benchmarks/baseline.json
+    python benchmarks/load_test.py --override PASSWORD_HASH_METHOD='"pbkdf2:sha256:1000"' --mix login=1,search=4
+"""
+from gevent import monkey
+monkey.patch_all()
+
+import argparse, json, random, sys, time, urllib.error, urllib.request
+from gevent.pool import Pool
+from gevent.pywsgi import WSGIServer
+
+from common import build_app, seed, auth_headers, summarize, write_results
+
+from App.database import db
+
+ENDPOINTS = ('login', 'search', 'list_reviews', 'review')
+DEFAULT_MIX = 'login=5,search=35,list_reviews=45,review=15'
+
+def request(url, data=None, headers=None):
+    body = json.dumps(data).encode() if data is not None else None
+    req = urllib.request.Request(url, data=body, headers={'Content-Type': 'application/json', **(headers or {})})
+    try:
+        with urllib.request.urlopen(req) as response:
+            response.read()
+            return response.status
+    except urllib.error.HTTPError as e:
+        return e.code
+
+def parse_mix(mix):
+    weights = {}
+    for part in mix.split(','):
+        name, _, weight = part.partition('=')
+        if name not in ENDPOINTS:
+            raise argparse.ArgumentTypeError(f'Unknown Endpoint {name!r}, Expected One Of: {", ".join(ENDPOINTS)}')
+        weights[name] = float(weight or 1)
+    return weights
+
+def parse_override(value):
+    key, _, raw = value.partition('=')
+    try:
+        return key, json.loads(raw)
+    except ValueError:
+        return key, raw
+
+class Workload:
+    """Builds one request per call, chosen at random by the --mix weights."""
+
+    def __init__(self, base, student_ids, staff_ids, weights, seed_value):
+        self.base = base
+        self.student_ids = student_ids
+        self.staff_ids = staff_ids
+        self.headers = {staff_id: auth_headers(staff_id) for staff_id in staff_ids}
+        self.names, self.weights = zip(*weights.items())
+        self.rng = random.Random(seed_value)
+
+    def next(self):
+        name = self.rng.choices(self.names, self.weights)[0]
+        staff_id = self.rng.choice(self.staff_ids)
+        student_id = self.rng.choice(self.student_ids)
+        headers = self.headers[staff_id]
+        if name == 'login':
+            return name, (f'{self.base}/login', {'email': f'staff{staff_id - 1}@mail.com', 'password': 'benchpass'}, None)
+        if name == 'search':
+            return name, (f'{self.base}/search?q=First{str(student_id)[:-1]}', None, headers)
+        if name == 'list_reviews':
+            return name, (f'{self.base}/list_reviews/{student_id}', None, headers)
+        return name, (f'{self.base}/review/{student_id}', {'text': f'Load Test Review {self.rng.random()}', 'rating': 4}, headers)
+
+def drive(workload, concurrency, duration):
+    samples = {name: [] for name in ENDPOINTS}
+    errors = {name: 0 for name in ENDPOINTS}
+    deadline = time.perf_counter() + duration
+
+    def user(_):
+        while time.perf_counter() < deadline:
+            name, (url, data, headers) = workload.next()
+            start = time.perf_counter()
+            status = request(url, data, headers)
+            samples[name].append((time.perf_counter() - start) * 1000)
+            if status >= 400:
+                errors[name] += 1
+
+    started = time.perf_counter()
+    Pool(concurrency).map(user, range(concurrency))
+    elapsed = time.perf_counter() - started
+
+    results = {}
+    for name in ENDPOINTS:
+        if samples[name]:
+            results[name] = {'rps': len(samples[name]) / elapsed, 'errors': errors[name], 'latency_ms': summarize(samples[name])}
+    total = sum(len(values) for values in samples.values())
+    results['total'] = {'rps': total / elapsed, 'errors': sum(errors.values()),
+                        'latency_ms': summarize([value for values in samples.values() for value in values])}
+    return results
+
+# Endpoints Whose p95 Latency Rose Or Throughput Fell By More Than `tolerance` (A Fraction) Against The Baseline
+def compare(results, baseline, tolerance):
+    regressions = []
+    for name, current in results['endpoints'].items():
+        previous = baseline['endpoints'].get(name)
+        if previous is None:
+            continue
+        if current['latency_ms']['p95'] > previous['latency_ms']['p95'] * (1 + tolerance):
+            regressions.append(f"{name}: p95 {previous['latency_ms']['p95']:.1f}ms -> {current['latency_ms']['p95']:.1f}ms")
+        if current['rps'] < previous['rps'] * (1 - tolerance):
+            regressions.append(f"{name}: {previous['rps']:.1f} -> {current['rps']:.1f} req/s")
+    return regressions
+
+def run(args):
+    app = build_app(args.database_url, dict(args.override))
+    student_ids, staff_ids = seed(students=args.students, staff=args.staff, reviews=args.reviews)
+
+    server = WSGIServer(('127.0.0.1', 0), app, log=None)
+    server.start()
+    try:
+        workload = Workload(f'http://127.0.0.1:{server.server_port}', student_ids, staff_ids, args.mix, args.seed)
+        if args.warmup:
+            drive(workload, args.concurrency, args.warmup)
+        endpoints = drive(workload, args.concurrency, args.duration)
+    finally:
+        server.stop()
+
+    return {
+        'config': {'students': args.students, 'staff': args.staff, 'reviews': args.reviews,
+                   'concurrency': args.concurrency, 'duration': args.duration, 'mix': args.mix,
+                   'overrides': dict(args.override), 'dialect': db.engine.dialect.name},
+        'endpoints': endpoints,
+    }
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--database-url', default='sqlite:////tmp/load-test.db')
+    parser.add_argument('--students', type=int, default=1000)
+    parser.add_argument('--staff', type=int, default=10)
+    parser.add_argument('--reviews', type=int, default=20000)
+    parser.add_argument('--concurrency', type=int, default=20)
+    parser.add_argument('--duration', type=float, default=20.0, help='Seconds To Measure')
+    parser.add_argument('--warmup', type=float, default=2.0, help='Seconds Of Unmeasured Load First')
+    parser.add_argument('--mix', type=parse_mix, default=parse_mix(DEFAULT_MIX), help=f'Endpoint Weights (Default: {DEFAULT_MIX})')
+    parser.add_argument('--override', type=parse_override, action='append', default=[], metavar='KEY=JSON',
+                        help='App Config Override Passed To create_app (Repeatable)')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--baseline', help='Compare Against This Saved Run & Exit 1 On Regressions')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='Allowed Regression As A Fraction (Default: 0.2)')
+    parser.add_argument('--save-baseline', help='Save This Run As The Baseline')
+    parser.add_argument('--output', help='Write the results as JSON to this file')
+    args = parser.parse_args()
+
+    results = run(args)
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+        results['regressions'] = compare(results, baseline, args.tolerance)
+        if baseline.get('config') != json.loads(json.dumps(results['config'], default=str)):
+            print('Warning: The Baseline Was Recorded With A Different Config', file=sys.stderr)
+    write_results(args.output, results)
+    if args.save_baseline:
+        with open(args.save_baseline, 'w') as file:
+            json.dump(results, file, indent=2, default=str)
+    if results.get('regressions'):
+        print('Regressions:\n  ' + '\n  '.join(results['regressions']), file=sys.stderr)
+        sys.exit(1)
@@ -0,0 +1,81 @@
+"""Latency of other endpoints while a burst of logins is in progress.
+
+Serves the app with gevent's WSGI server (as the gunicorn gevent worker
+does), probes /search/<id> while N concurrent greenlets log in, and
+compares password hashing in gevent's thread pool against hashing inline
+on the event loop (PASSWORD_HASH_OFFLOAD=False).
+
+    python benchmarks/login_concurrency.py --logins 200 --concurrency 20
+"""
+from gevent import monkey
+monkey.patch_all()
+
+import argparse, json, urllib.request
+import gevent, gevent.event
+from gevent.pool import Pool
+from gevent.pywsgi import WSGIServer
+
+from common import build_app, seed, auth_headers, summarize, write_results, timed
+
+def request(url, data=None, headers=None):
+    body = json.dumps(data).encode() if data is not None else None
+    req = urllib.request.Request(url, data=body, headers={'Content-Type': 'application/json', **(headers or {})})
+    with urllib.request.urlopen(req) as response:
+        return response.read()
+
+def probe(url, headers, stop, samples, interval):
+    while not stop.is_set():
+        elapsed, _ = timed(request, url, headers=headers)
+        samples.append(elapsed)
+        gevent.sleep(interval)
+
+def run_phase(base, probe_url, headers, args, with_logins):
+    stop, samples, logins = gevent.event.Event(), [], []
+    prober = gevent.spawn(probe, probe_url, headers, stop, samples, args.probe_interval)
+    if with_logins:
+        def login(_):
+            elapsed, _ = timed(request, f'{base}/login', {'email': 'staff1@mail.com', 'password': 'benchpass'})
+            logins.append(elapsed)
+        Pool(args.concurrency).map(login, range(args.logins))
+    else:
+        gevent.sleep(args.idle_seconds)
+    stop.set()
+    prober.join()
+    result = {'probe_ms': summarize(samples)}
+    if with_logins:
+        result['login_ms'] = summarize(logins)
+    return result
+
+def run(args):
+    app = build_app(args.database_url)
+    student_ids, staff_ids = seed(students=100, staff=2, reviews=1000)
+    headers = auth_headers(staff_ids[0])
+
+    server = WSGIServer(('127.0.0.1', 0), app, log=None)
+    server.start()
+    base = f'http://127.0.0.1:{server.server_port}'
+    probe_url = f'{base}/search/{student_ids[0]}'
+
+    results = {'logins': args.logins, 'concurrency': args.concurrency,
+               'hash_method': app.config.get('PASSWORD_HASH_METHOD')}
+    try:
+        for label, offload in (('thread_pool', True), ('inline', False)):
+            app.config['PASSWORD_HASH_OFFLOAD'] = offload
+            results[label] = {
+                'idle': run_phase(base, probe_url, headers, args, with_logins=False),
+                'during_logins': run_phase(base, probe_url, headers, args, with_logins=True),
+            }
+    finally:
+        server.stop()
+    return results
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--database-url', default='sqlite:////tmp/login-bench.db')
+    parser.add_argument('--logins', type=int, default=200)
+    parser.add_argument('--concurrency', type=int, default=20)
+    parser.add_argument('--idle-seconds', type=float, default=2.0)
+    parser.add_argument('--probe-interval', type=float, default=0.005)
+    parser.add_argument('--output', help='Write the results as JSON to this file')
+    args = parser.parse_args()
+    write_results(args.output, run(args))
@@ -0,0 +1,98 @@
+"""Concurrent review writers on SQLite, default settings vs the tuning profile.
+
+Starts --processes worker processes (like gunicorn workers), each running
+--threads writer threads that add --writes reviews through add_review. Run
+once with SQLite's defaults (rollback journal, no write lock) and once with
+SQLITE_PRAGMAS (WAL, synchronous=NORMAL, ...) plus the per-process write
+lock, reporting throughput, per-write latency and "database is locked"
+failures for each.
+
+    python benchmarks/sqlite_writers.py --processes 4 --threads 8 --writes 50
+"""
+import argparse, multiprocessing, os, threading, time
+
+from common import build_app, seed, summarize, timed, write_results
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import OperationalError
+from App.main import create_app
+from App.database import db
+from App.controllers import add_review, get_student
+from App.default_config import SQLITE_PRAGMAS
+
+PROFILES = {
+    'default': {'SQLITE_PRAGMAS': {}, 'SQLITE_SERIALIZE_WRITES': False},
+    'tuned': {'SQLITE_PRAGMAS': SQLITE_PRAGMAS, 'SQLITE_SERIALIZE_WRITES': True},
+}
+
+def worker(database_url, profile, threads, writes, student_ids, staff_ids, results):
+    app = create_app({'TESTING': True, 'SQLALCHEMY_DATABASE_URI': database_url, **PROFILES[profile]})
+    samples, failures = [], []
+
+    def write(n):
+        with app.app_context():
+            for i in range(writes):
+                student_id = student_ids[(n * writes + i) % len(student_ids)]
+                # Like POST /review/<id>: Look The Student Up, Then Write
+                start = time.perf_counter()
+                try:
+                    elapsed, review = timed(lambda: get_student(student_id) and add_review(
+                        student_id, f'Concurrent Review {n}-{i}', 3, staff_ids[n % len(staff_ids)]))
+                except OperationalError:
+                    # "database is locked" - Counted As A Failed Write, The Thread Carries On
+                    db.session.rollback()
+                    elapsed, review = (time.perf_counter() - start) * 1000, None
+                (samples if review else failures).append(elapsed)
+
+    pool = [threading.Thread(target=write, args=(n,)) for n in range(threads)]
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    results.put((samples, len(failures)))
+
+def run_profile(args, profile, student_ids, staff_ids):
+    results = multiprocessing.Queue()
+    processes = [multiprocessing.Process(target=worker, args=(args.database_url, profile, args.threads, args.writes,
+                                                              student_ids, staff_ids, results))
+                 for _ in range(args.processes)]
+    start = time.perf_counter()
+    for process in processes:
+        process.start()
+    outcomes = [results.get() for _ in processes]
+    for process in processes:
+        process.join()
+    elapsed = time.perf_counter() - start
+
+    samples = [sample for outcome in outcomes for sample in outcome[0]]
+    failures = sum(outcome[1] for outcome in outcomes)
+    return {'writes': len(samples), 'failed': failures, 'seconds': elapsed,
+            'writes_per_second': len(samples) / elapsed, 'latency_ms': summarize(samples)}
+
+# WAL Mode Is Stored In The Database File, So Each Profile Starts From A New File
+def remove_database(database_url):
+    path = make_url(database_url).database
+    for suffix in ('', '-wal', '-shm', '-journal'):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+
+def run(args):
+    results = {'processes': args.processes, 'threads': args.threads, 'writes_per_thread': args.writes}
+    for profile in PROFILES:
+        remove_database(args.database_url)
+        build_app(args.database_url, PROFILES[profile])
+        student_ids, staff_ids = seed(students=args.students, staff=args.staff, reviews=0)
+        results[profile] = run_profile(args, profile, student_ids, staff_ids)
+    return results
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--database-url', default='sqlite:////tmp/sqlite-writers-bench.db')
+    parser.add_argument('--processes', type=int, default=4)
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--writes', type=int, default=50)
+    parser.add_argument('--students', type=int, default=1000)
+    parser.add_argument('--staff', type=int, default=10)
+    parser.add_argument('--output', help='Write the results as JSON to this file')
+    args = parser.parse_args()
+    write_results(args.output, run(args))
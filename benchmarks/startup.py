@@ -0,0 +1,102 @@
+"""Cold start: import time and time to first response, "api" vs "full" profile.
+
+Each run starts a fresh interpreter, like a free-tier instance spinning up.
+The import breakdown comes from ``python -X importtime -c "import wsgi"``
+(slowest modules by cumulative time). Time to first response is measured
+from spawning a process that imports wsgi and serves ``app`` until its
+first /healthcheck answers 200. The "full" profile is what ``flask
+<command>`` loads (create_app() plus the command line).
+
+    python benchmarks/startup.py --runs 5
+    python benchmarks/startup.py --runs 10 --top 15 --output startup.json
+"""
+import argparse, os, socket, subprocess, sys, tempfile, time, urllib.error, urllib.request
+
+from common import summarize, write_results
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Environment For Each Profile - wsgi.py Picks The Profile From These
+PROFILES = {
+    'api': {'APP_PROFILE': 'api'},
+    'full': {'FLASK_RUN_FROM_CLI': 'true'},
+}
+
+SERVE = '''
+import sys
+from wsgiref.simple_server import make_server, WSGIRequestHandler
+from wsgi import app
+
+class QuietHandler(WSGIRequestHandler):
+    def log_message(self, *args):
+        pass
+
+server = make_server('127.0.0.1', int(sys.argv[1]), app, handler_class=QuietHandler)
+server.handle_request()
+'''
+
+def profile_env(profile, database_url):
+    env = {key: value for key, value in os.environ.items() if key not in ('APP_PROFILE', 'FLASK_RUN_FROM_CLI')}
+    env.update(PROFILES[profile], FLASK_SQLALCHEMY_DATABASE_URI=database_url, FLASK_LOG_LEVEL='WARNING')
+    return env
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+# [(Cumulative Microseconds, Module)] Of One `import wsgi`, Slowest First
+def import_times(env):
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import wsgi'], cwd=ROOT, env=env,
+                            capture_output=True, text=True, check=True)
+    modules = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        modules.append((int(cumulative), name.strip()))
+    return sorted(modules, reverse=True)
+
+def first_response(env, timeout=30.0):
+    port = free_port()
+    started = time.perf_counter()
+    process = subprocess.Popen([sys.executable, '-c', SERVE, str(port)], cwd=ROOT, env=env,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        while time.perf_counter() - started < timeout:
+            try:
+                with urllib.request.urlopen(f'http://127.0.0.1:{port}/healthcheck', timeout=1) as response:
+                    if response.status == 200:
+                        return (time.perf_counter() - started) * 1000
+            except (urllib.error.URLError, ConnectionError):
+                time.sleep(0.005)
+        raise RuntimeError(f'No Response Within {timeout}s')
+    finally:
+        process.kill()
+        process.wait()
+
+def run(args):
+    results = {'runs': args.runs}
+    with tempfile.TemporaryDirectory() as directory:
+        database_url = f"sqlite:///{os.path.join(directory, 'startup.db')}"
+        for profile in PROFILES:
+            env = profile_env(profile, database_url)
+            imports, responses, modules = [], [], []
+            for _ in range(args.runs):
+                modules = import_times(env)
+                imports.append(next(us for us, name in modules if name == 'wsgi') / 1000)
+                responses.append(first_response(env))
+            results[profile] = {
+                'import_ms': summarize(imports),
+                'first_response_ms': summarize(responses),
+                'slowest_imports_ms': {name: us / 1000 for us, name in modules[:args.top]},
+            }
+    return results
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--top', type=int, default=10, help='Slowest Imports To Report')
+    parser.add_argument('--output', help='Write the results as JSON to this file')
+    args = parser.parse_args()
+    write_results(args.output, run(args))
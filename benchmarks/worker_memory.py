@@ -0,0 +1,99 @@
+"""Memory per gunicorn worker, with and without preload_app (Linux, needs gunicorn).
+
+Starts ``gunicorn -c gunicorn_config.py wsgi:app`` with --workers workers,
+once with GUNICORN_PRELOAD=false and once with GUNICORN_PRELOAD=true, sends
+--requests requests spread over the workers, then reads each worker's RSS,
+PSS and USS from /proc/<pid>/smaps_rollup. RSS counts pages shared with the
+master in full; PSS splits them between the processes sharing them and USS
+counts only the worker's own pages, so preloading shows up in PSS/USS.
+Also reports how long the server took to answer its first request.
+
+    python benchmarks/worker_memory.py --workers 4 --requests 400
+"""
+import argparse, os, socket, subprocess, sys, tempfile, time, urllib.error, urllib.request
+
+from common import summarize, write_results
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+def get(url):
+    try:
+        with urllib.request.urlopen(url, timeout=5) as response:
+            response.read()
+            return response.status
+    except urllib.error.HTTPError as e:
+        return e.code
+
+def wait_until_up(server, url, timeout=60.0):
+    started = time.perf_counter()
+    while time.perf_counter() - started < timeout:
+        if server.poll() is not None:
+            raise RuntimeError(f'gunicorn Exited With Status {server.returncode}')
+        try:
+            if get(url) == 200:
+                return (time.perf_counter() - started) * 1000
+        except (urllib.error.URLError, ConnectionError):
+            time.sleep(0.01)
+    raise RuntimeError(f'gunicorn Did Not Answer Within {timeout}s')
+
+def children(pid):
+    with open(f'/proc/{pid}/task/{pid}/children') as file:
+        return [int(child) for child in file.read().split()]
+
+# {'rss': KiB, 'pss': KiB, 'uss': KiB} From /proc/<pid>/smaps_rollup
+def memory(pid):
+    fields = {}
+    with open(f'/proc/{pid}/smaps_rollup') as file:
+        for line in file:
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == 'kB':
+                fields[parts[0].rstrip(':')] = int(parts[1])
+    return {'rss': fields['Rss'], 'pss': fields['Pss'], 'uss': fields['Private_Clean'] + fields['Private_Dirty']}
+
+def run_server(args, preload, database_url):
+    port = free_port()
+    env = dict(os.environ, GUNICORN_PRELOAD=str(preload).lower(), FLASK_SQLALCHEMY_DATABASE_URI=database_url,
+               FLASK_LOG_LEVEL='WARNING', GUNICORN_MAX_REQUESTS='0')
+    server = subprocess.Popen([sys.executable, '-m', 'gunicorn', '-c', 'gunicorn_config.py', '-b', f'127.0.0.1:{port}',
+                               '-w', str(args.workers), 'wsgi:app'],
+                              cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        url = f'http://127.0.0.1:{port}/healthcheck'
+        first_response = wait_until_up(server, url)
+        for _ in range(args.requests):
+            get(url)
+        while len(children(server.pid)) < args.workers:
+            time.sleep(0.05)
+        workers = [memory(pid) for pid in children(server.pid)]
+        return {
+            'first_response_ms': first_response,
+            'master_kib': memory(server.pid),
+            'rss_kib': summarize([worker['rss'] for worker in workers]),
+            'pss_kib': summarize([worker['pss'] for worker in workers]),
+            'uss_kib': summarize([worker['uss'] for worker in workers]),
+            'total_pss_kib': memory(server.pid)['pss'] + sum(worker['pss'] for worker in workers),
+        }
+    finally:
+        server.terminate()
+        server.wait()
+
+def run(args):
+    results = {'workers': args.workers, 'requests': args.requests}
+    with tempfile.TemporaryDirectory() as directory:
+        database_url = f"sqlite:///{os.path.join(directory, 'worker-memory.db')}"
+        for preload in (False, True):
+            results['preload' if preload else 'no_preload'] = run_server(args, preload, database_url)
+    return results
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--requests', type=int, default=400, help='Requests Sent Before Measuring')
+    parser.add_argument('--output', help='Write the results as JSON to this file')
+    args = parser.parse_args()
+    write_results(args.output, run(args))
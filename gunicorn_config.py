@@ -1,19 +1,97 @@
 # gunicorn_config.py
-import multiprocessing
+import multiprocessing, os, runpy, tempfile
+
+def env_int(name, default):
+    value = os.environ.get(name)
+    return int(value) if value not in (None, '') else default
+
+def env_bool(name, default):
+    value = os.environ.get(name)
+    return value.lower() in ('1', 'true', 'yes', 'on') if value not in (None, '') else default
+
+# Database Connections One Worker Can Hold - The App's Pool Size Plus Overflow (FLASK_DB_* Overrides Included)
+# default_config.py Is Read By Path - Importing The App Package Here Would Load The Whole App In The Master
+def pool_connections():
+    defaults = runpy.run_path(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'App', 'default_config.py'))
+    return (env_int('FLASK_DB_POOL_SIZE', defaults['DB_POOL_SIZE'])
+            + env_int('FLASK_DB_MAX_OVERFLOW', defaults['DB_MAX_OVERFLOW']))
+
+# (2 x CPUs) + 1, But Never More Workers Than The Database's Connection Budget Can Give A Full Pool Each
+def worker_count(cpus, connections_per_worker, max_connections):
+    workers = 2 * cpus + 1
+    if max_connections:
+        workers = min(workers, max_connections // connections_per_worker)
+    return max(workers, 1)
+
+# Greenlets Per Worker - Enough To Keep Every Pooled Connection Busy While Other Requests Are Between Queries,
+# Few Enough That A Burst Waits In The Listen Backlog Rather Than On DB_POOL_TIMEOUT
+def connection_count(connections_per_worker, greenlets_per_connection):
+    return connections_per_worker * greenlets_per_connection
 
 # The socket to bind.
-# "0.0.0.0" to bind to all interfaces. 8000 is the port number.
-bind = "0.0.0.0:8080"
+# "0.0.0.0" to bind to all interfaces. 8080 is the port number (unless the host sets PORT).
+bind = f"0.0.0.0:{env_int('PORT', 8080)}"
 
 # The number of worker processes for handling requests.
-workers = 4
+# WEB_CONCURRENCY Overrides It; DB_MAX_CONNECTIONS Is The Server's Connection Limit (0 = Unlimited)
+connections_per_worker = pool_connections()
+workers = env_int('WEB_CONCURRENCY', worker_count(multiprocessing.cpu_count(), connections_per_worker,
+                                                  env_int('DB_MAX_CONNECTIONS', 0)))
 
 # Use the 'gevent' worker type for async performance.
 worker_class = 'gevent'
+worker_connections = env_int('GUNICORN_WORKER_CONNECTIONS',
+                             connection_count(connections_per_worker, env_int('GUNICORN_GREENLETS_PER_CONNECTION', 8)))
+
+# Import The App Once In The Master & Fork Workers From It - Faster Startup & Restarts, Shared Memory Pages
+# (post_fork Below Makes This Safe)
+preload_app = env_bool('GUNICORN_PRELOAD', True)
+
+# Recycle Each Worker After Roughly This Many Requests To Cap Memory Growth - The Jitter Staggers The Restarts
+max_requests = env_int('GUNICORN_MAX_REQUESTS', 1000)
+max_requests_jitter = env_int('GUNICORN_MAX_REQUESTS_JITTER', max_requests // 10)
+
+# Workers Add Up Their /metrics Through Per-Worker Files In FLASK_METRICS_DIR - Defaults To A Directory Per Port
+# Under The System Temp Directory. Passed Through raw_env, Which gunicorn Applies Before It Loads The App, So Every
+# Worker (Preloaded Or Not) Uses It & Importing This File (e.g. From The Tests) Leaves os.environ Alone
+metrics_dir = os.environ.get('FLASK_METRICS_DIR', os.path.join(tempfile.gettempdir(), f"app-metrics-{env_int('PORT', 8080)}"))
+raw_env = [] if 'FLASK_METRICS_DIR' in os.environ else [f'FLASK_METRICS_DIR={metrics_dir}']
 
 # Log level
 loglevel = 'info'
 
 # Where to log to
 accesslog = '-'  # '-' means log to stdout
-errorlog = '-'  # '-' means log to stderr
\ No newline at end of file
+errorlog = '-'  # '-' means log to stderr
+
+# Start Each Run With An Empty Metrics Directory
+def on_starting(server):
+    if metrics_dir:
+        from App.metrics import clear_snapshots
+        os.makedirs(metrics_dir, exist_ok=True)
+        clear_snapshots(metrics_dir)
+
+# A Worker Exiting (e.g. Recycled After max_requests) Writes Its Latest Numbers...
+def worker_exit(server, worker):
+    if metrics_dir:
+        from App.metrics import flush_metrics
+        if getattr(worker, "wsgi", None) is not None:
+            flush_metrics(worker.wsgi)
+
+# ...Which The Master Then Folds Into One File For All Exited Workers, So Counters Never Go Backwards
+def child_exit(server, worker):
+    if metrics_dir:
+        from App.metrics import fold_snapshot
+        fold_snapshot(metrics_dir, worker.pid)
+
+# A Preloaded App Was Imported Before fork() - Give This Worker Its Own Connections & Empty Caches
+# (Without preload_app The App Isn't Loaded Yet & Must Not Be, gevent Hasn't Patched The Worker)
+def post_fork(server, worker):
+    if server.cfg.preload_app:
+        from App.main import reset_after_fork
+        reset_after_fork(worker.app.wsgi())
+
+# Runs After The gevent Worker Has Monkey Patched & Loaded The App
+def post_worker_init(worker):
+    from App.main import init_worker
+    init_worker(worker.wsgi)
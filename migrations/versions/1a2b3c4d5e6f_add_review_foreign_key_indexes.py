@@ -0,0 +1,34 @@
+"""add review foreign key indexes
+
+Revision ID: 1a2b3c4d5e6f
+Revises: 
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '1a2b3c4d5e6f'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def _existing_indexes(table):
+    return {index['name'] for index in sa.inspect(op.get_bind()).get_indexes(table)}
+
+
+def upgrade():
+    # databases built by `flask init` (db.create_all) already have these
+    existing = _existing_indexes('review')
+    if 'ix_review_reviewer_id' not in existing:
+        op.create_index('ix_review_reviewer_id', 'review', ['reviewer_id'], unique=False)
+    if 'ix_review_student_id_id' not in existing:
+        op.create_index('ix_review_student_id_id', 'review', ['student_id', 'id'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_review_student_id_id', table_name='review')
+    op.drop_index('ix_review_reviewer_id', table_name='review')
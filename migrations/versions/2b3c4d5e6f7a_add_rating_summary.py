@@ -0,0 +1,52 @@
+"""add rating summary
+
+Revision ID: 2b3c4d5e6f7a
+Revises: 1a2b3c4d5e6f
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '2b3c4d5e6f7a'
+down_revision = '1a2b3c4d5e6f'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # databases built by `flask init` (db.create_all) already have the table
+    if 'rating_summary' in sa.inspect(op.get_bind()).get_table_names():
+        return
+
+    op.create_table('rating_summary',
+    sa.Column('student_id', sa.Integer(), nullable=False),
+    sa.Column('review_count', sa.Integer(), nullable=False),
+    sa.Column('rating_sum', sa.Integer(), nullable=False),
+    sa.Column('rating_min', sa.Integer(), nullable=True),
+    sa.Column('rating_max', sa.Integer(), nullable=True),
+    sa.Column('rating_1', sa.Integer(), nullable=False),
+    sa.Column('rating_2', sa.Integer(), nullable=False),
+    sa.Column('rating_3', sa.Integer(), nullable=False),
+    sa.Column('rating_4', sa.Integer(), nullable=False),
+    sa.Column('rating_5', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['student_id'], ['student.student_id'], ),
+    sa.PrimaryKeyConstraint('student_id')
+    )
+
+    # backfill from the existing reviews
+    op.execute(
+        "INSERT INTO rating_summary (student_id, review_count, rating_sum, rating_min, rating_max, "
+        "rating_1, rating_2, rating_3, rating_4, rating_5) "
+        "SELECT student_id, count(*), sum(rating), min(rating), max(rating), "
+        "sum(CASE WHEN rating = 1 THEN 1 ELSE 0 END), sum(CASE WHEN rating = 2 THEN 1 ELSE 0 END), "
+        "sum(CASE WHEN rating = 3 THEN 1 ELSE 0 END), sum(CASE WHEN rating = 4 THEN 1 ELSE 0 END), "
+        "sum(CASE WHEN rating = 5 THEN 1 ELSE 0 END) "
+        "FROM review GROUP BY student_id"
+    )
+
+
+def downgrade():
+    op.drop_table('rating_summary')
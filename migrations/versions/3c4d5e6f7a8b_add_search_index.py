@@ -0,0 +1,28 @@
+"""add full-text search index
+
+Revision ID: 3c4d5e6f7a8b
+Revises: 2b3c4d5e6f7a
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from App.models.search_index import create_search_index, drop_search_index
+
+
+# revision identifiers, used by Alembic.
+revision = '3c4d5e6f7a8b'
+down_revision = '2b3c4d5e6f7a'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # FTS5 tables + triggers on SQLite, tsvector/trigram GIN indexes on Postgres;
+    # the SQLite tables are rebuilt from the existing rows
+    create_search_index(op.get_bind(), rebuild=True)
+
+
+def downgrade():
+    drop_search_index(op.get_bind())
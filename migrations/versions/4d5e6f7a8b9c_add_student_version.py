@@ -0,0 +1,39 @@
+"""add student version
+
+Revision ID: 4d5e6f7a8b9c
+Revises: 3c4d5e6f7a8b
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from App.models.search_index import create_search_index
+
+
+# revision identifiers, used by Alembic.
+revision = '4d5e6f7a8b9c'
+down_revision = '3c4d5e6f7a8b'
+branch_labels = None
+depends_on = None
+
+
+def _columns(table):
+    return {column['name'] for column in sa.inspect(op.get_bind()).get_columns(table)}
+
+
+def upgrade():
+    # databases built by `flask init` (db.create_all) already have the column
+    if 'version' not in _columns('student'):
+        op.add_column('student', sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+
+    # version bumps are updates too - narrow the SQLite search triggers to the indexed columns
+    if op.get_bind().dialect.name == 'sqlite':
+        op.execute("DROP TRIGGER IF EXISTS student_fts_update")
+        op.execute("DROP TRIGGER IF EXISTS review_fts_update")
+        create_search_index(op.get_bind())
+
+
+def downgrade():
+    with op.batch_alter_table('student') as batch_op:
+        batch_op.drop_column('version')
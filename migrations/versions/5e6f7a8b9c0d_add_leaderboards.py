@@ -0,0 +1,57 @@
+"""add leaderboards
+
+Revision ID: 5e6f7a8b9c0d
+Revises: 4d5e6f7a8b9c
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5e6f7a8b9c0d'
+down_revision = '4d5e6f7a8b9c'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # databases built by `flask init` (db.create_all) already have the tables
+    tables = sa.inspect(op.get_bind()).get_table_names()
+
+    if 'reviewer_stats' not in tables:
+        op.create_table('reviewer_stats',
+        sa.Column('staff_id', sa.Integer(), nullable=False),
+        sa.Column('review_count', sa.Integer(), nullable=False),
+        sa.Column('rating_sum', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['staff_id'], ['staff.id'], ),
+        sa.PrimaryKeyConstraint('staff_id')
+        )
+
+    if 'leaderboard_entry' not in tables:
+        op.create_table('leaderboard_entry',
+        sa.Column('board', sa.String(length=32), nullable=False),
+        sa.Column('rank', sa.Integer(), nullable=False),
+        sa.Column('subject_id', sa.Integer(), nullable=False),
+        sa.Column('review_count', sa.Integer(), nullable=False),
+        sa.Column('rating_sum', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('board', 'rank')
+        )
+
+    # no backfill - the first refresh (with no state row) rebuilds the leaderboards from every review
+    if 'leaderboard_state' not in tables:
+        op.create_table('leaderboard_state',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('high_water_mark', sa.Integer(), nullable=False),
+        sa.Column('refreshed_at', sa.DateTime(), nullable=True),
+        sa.Column('rebuilt_at', sa.DateTime(), nullable=True),
+        sa.Column('percentiles', sa.JSON(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+        )
+
+
+def downgrade():
+    op.drop_table('leaderboard_state')
+    op.drop_table('leaderboard_entry')
+    op.drop_table('reviewer_stats')